@@ -278,7 +278,7 @@ FUNNEL_CONFIG = {
 }
 
 # Initialize configuration manager (global for simplicity or pass instance)
-config_manager = ConfigurationManager(project_name="axeScraper")
+config_manager = ConfigurationManager.get_instance("axeScraper")
 
 class AccessibilityAnalyzer:
     """
@@ -2596,7 +2596,7 @@ def main():
     try:
         # Initialize configuration and output managers
         # Assume ConfigurationManager can find its config file
-        config = ConfigurationManager()
+        config = ConfigurationManager.get_instance()
         # Load domain specific config if needed (though not directly used in analyzer currently)
         # domain_config = config.load_domain_config(args.domain)
 
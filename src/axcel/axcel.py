@@ -39,7 +39,7 @@ from utils.output_manager import OutputManager
 
 
 # Initialize configuration manager
-config_manager = ConfigurationManager(project_name="axeScraper")
+config_manager = ConfigurationManager.get_instance("axeScraper")
 base_urls = config_manager.get_list("BASE_URLS")
 real_domain = base_urls[0] if base_urls else None
 if not real_domain:
@@ -59,7 +59,7 @@ class MultiDomainSpider(scrapy.Spider):
         self.config_manager = None
         if ConfigurationManager:
             try:
-                self.config_manager = ConfigurationManager()
+                self.config_manager = ConfigurationManager.get_instance()
                 self.logger.info("Configuration manager initialized successfully")
             except Exception as e:
                 self.logger.warning(f"Failed to initialize configuration manager: {e}")
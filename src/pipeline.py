@@ -14,6 +14,7 @@ Utilizza i gestori centralizzati per:
 """
 
 import asyncio
+import logging
 import os
 import signal
 import time
@@ -26,6 +27,7 @@ import pandas as pd
 import re
 import shutil
 from datetime import datetime
+from functools import lru_cache
 
 # Import delle classi centrali di gestione
 from utils.config_manager import ConfigurationManager, get_config_manager
@@ -46,6 +48,15 @@ output_managers = {}
 shutdown_flag = False
 start_time = time.time()
 
+# Fasi eseguite per ciascuno stage di partenza
+PHASE_PLAN = {
+    "crawler": ("crawler", "axe", "funnel", "report"),
+    "auth": ("axe", "funnel", "report"),
+    "axe": ("axe", "funnel", "report"),
+    "funnel": ("funnel", "report"),
+    "report": ("report",),
+}
+
 class Pipeline:
     """
     Orchestratore completo del pipeline di accessibilità che gestisce:
@@ -64,7 +75,7 @@ class Pipeline:
             config_file: Percorso del file di configurazione (opzionale)
             cli_args: Argomenti da linea di comando (opzionale)
         """
-        self.config_manager = ConfigurationManager(
+        self.config_manager = ConfigurationManager.get_instance(
             project_name="axeScraper",
             config_file=config_file,
             cli_args=cli_args or {}
@@ -105,6 +116,12 @@ class Pipeline:
         # Carica pipeline config
         self.pipeline_config = self.config_manager.get_pipeline_config()
         
+        # Valori letti una sola volta e riutilizzati per ogni dominio
+        self._start_stage = self.pipeline_config.get("start_stage") or self.config_manager.get("START_STAGE", "crawler")
+        self._send_email = self.config_manager.get_bool("SEND_EMAIL", False)
+        self._auth_enabled = self.config_manager.get_bool("AUTH_ENABLED", False)
+        self._funnel_enabled = self.config_manager.get_bool("FUNNEL_ANALYSIS_ENABLED", False)
+        
         # Log dei parametri chiave (usando le chiavi standardizzate)
         self.logger.info("Parametri chiave di configurazione:")
         self.logger.info(f"CRAWLER_MAX_URLS: {self.config_manager.get_int('CRAWLER_MAX_URLS')}")
@@ -188,21 +205,26 @@ class Pipeline:
         
         threshold_cpu = resource_config.get("threshold_cpu", 90)
         threshold_memory = resource_config.get("threshold_memory", 85)
-        check_interval = resource_config.get("check_interval", 3)
+        # Intervallo minimo di 5 secondi per contenere l'overhead di polling
+        check_interval = max(resource_config.get("check_interval", 5), 5)
         cool_down_time = resource_config.get("cool_down_time", 7)
         
         if not resource_config.get("enabled", True):
             self.logger.info("Monitoraggio risorse disabilitato da configurazione")
             return
             
+        # Inizializza il campionamento CPU: le chiamate successive con interval=None
+        # misurano dall'ultima lettura senza bloccare l'event loop
+        psutil.cpu_percent(interval=None)
+            
         try:
             while not self.shutdown_flag:
                 try:
-                    cpu = psutil.cpu_percent(interval=0.5)
+                    cpu = psutil.cpu_percent(interval=None)
                     mem = psutil.virtual_memory().percent
                     
                     # Log metriche periodicamente
-                    if (time.time() - self.start_time) % 60 < 3:
+                    if (time.time() - self.start_time) % 60 < check_interval:
                         elapsed = time.time() - self.start_time
                         if elapsed > 0:
                             self.logger.info(f"Performance: CPU={cpu:.1f}%, Memoria={mem:.1f}%, "
@@ -506,37 +528,36 @@ class Pipeline:
             # Read Excel with sheet_name=None to get a dict of all sheets
             excel_data = pd.read_excel(excel_output_path, sheet_name=None)
             
+            # Lookup tables URL -> step metadata, applied column-wise with Series.map
+            step_by_url = {url: metadata["funnel_step"] for url, metadata in url_to_metadata.items()}
+            number_by_url = {url: metadata["step_number"] for url, metadata in url_to_metadata.items()}
+            violation_columns = ["violation_id", "impact", "description", "help", "target", "html", "failure_summary"]
+            
             for sheet_name, df in excel_data.items():
                 if df.empty:
                     continue
                     
-                # Process each row in the sheet
-                for _, row in df.iterrows():
-                    # Get original URL to retrieve metadata
-                    url = row.get('page_url', '')
-                    metadata = url_to_metadata.get(url, {})
-                    
-                    # Create extended violation record with funnel metadata
-                    violation = {
-                        "page_url": url,
-                        "funnel_name": metadata.get('funnel_name', funnel_id),
-                        "funnel_step": metadata.get('funnel_step', ''),
-                        "step_number": metadata.get('step_number', ''),
-                        "has_funnel_data": True,
-                        "violation_id": row.get('violation_id', ''),
-                        "impact": row.get('impact', ''),
-                        "description": row.get('description', ''),
-                        "help": row.get('help', ''),
-                        "target": row.get('target', ''),
-                        "html": row.get('html', ''),
-                        "failure_summary": row.get('failure_summary', '')
-                    }
-                    all_violations.append(violation)
+                # Build the extended violation records with funnel metadata column by column
+                page_urls = df['page_url'] if 'page_url' in df.columns else pd.Series('', index=df.index)
+                sheet_violations = pd.DataFrame({
+                    "page_url": page_urls,
+                    "funnel_name": funnel_id,
+                    "funnel_step": page_urls.map(step_by_url).fillna(''),
+                    "step_number": page_urls.map(number_by_url).fillna(''),
+                    "has_funnel_data": True
+                })
+                for col in violation_columns:
+                    sheet_violations[col] = df[col] if col in df.columns else ''
+                all_violations.append(sheet_violations)
             
             # Create combined DataFrame
             if all_violations:
-                self.logger.info(f"Found {len(all_violations)} accessibility violations across {len(file_urls)} funnel HTML files")
-                result_df = pd.DataFrame(all_violations)
+                result_df = pd.concat(all_violations, ignore_index=True)
+                self.logger.info(f"Found {len(result_df)} accessibility violations across {len(file_urls)} funnel HTML files")
+                
+                # Low-cardinality text columns are stored as categories to reduce memory
+                for col in ("funnel_name", "funnel_step", "step_number", "impact"):
+                    result_df[col] = result_df[col].astype("category")
                 
                 # Add funnel metadata to result_df
                 extra_cols = ["auth_required", "auth_strategy", "funnel_name", "funnel_step", "has_funnel_data"]
@@ -667,7 +688,7 @@ class Pipeline:
     
     async def run_report_analysis(self, base_url: str, domain_config: Dict[str, Any],
                                     output_manager: OutputManager,
-                                    funnel_metadata: Optional[Dict[str, Dict[str, Any]]] = None, # Non più usato direttamente dall'analyzer
+                                    funnel_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
                                     funnel_violations_df: Optional[pd.DataFrame] = None) -> Optional[str]:
             """
             Genera il report di accessibilità finale, combinando i risultati di Axe
@@ -678,7 +699,7 @@ class Pipeline:
                 base_url: URL target (usato per logging/contesto).
                 domain_config: Configurazione specifica del dominio (potrebbe non essere più necessaria qui).
                 output_manager: Gestore dell'output (usato per determinare i percorsi di input/output).
-                funnel_metadata: Metadati sui funnel (attualmente non usati direttamente qui).
+                funnel_metadata: Metadati sui funnel (URL -> dati funnel), applicati in memoria ai dati combinati.
                 funnel_violations_df: DataFrame opzionale con i risultati dell'analisi dei file HTML dei funnel.
 
             Returns:
@@ -721,46 +742,55 @@ class Pipeline:
             # --- Combina Dati Funnel HTML (se presenti) ---
             final_input_excel_path = str(path_to_load) # Default: usa il file (concatenato) trovato
 
-            if funnel_violations_df is not None and not funnel_violations_df.empty:
-                self.logger.info(f"Combinazione dei risultati Axe ({path_to_load}) con {len(funnel_violations_df)} violazioni da analisi funnel HTML...")
+            have_funnel_violations = funnel_violations_df is not None and not funnel_violations_df.empty
+            if have_funnel_violations or funnel_metadata:
+                if have_funnel_violations:
+                    self.logger.info(f"Combinazione dei risultati Axe ({path_to_load}) con {len(funnel_violations_df)} violazioni da analisi funnel HTML...")
+                else:
+                    self.logger.info(f"Applicazione dei metadati di {len(funnel_metadata)} URL funnel ai risultati Axe ({path_to_load})...")
                 try:
                     # Carica il DataFrame principale (dal file concatenato)
                     main_axe_df = pd.read_excel(path_to_load, sheet_name=0)
+                    combined_df_list = [main_axe_df]
 
-                    # Colonne extra da garantire
-                    extra_cols = ["auth_required", "auth_strategy", "funnel_name", "funnel_step", "has_funnel_data"]
-                    for col in extra_cols:
-                        if col not in main_axe_df.columns:
-                            if col == "has_funnel_data":
-                                main_axe_df[col] = False
-                            elif col == "auth_required":
-                                main_axe_df[col] = False
-                            else:
-                                main_axe_df[col] = "none"
-                        if col not in funnel_violations_df.columns:
-                            if col == "has_funnel_data":
-                                funnel_violations_df[col] = True
-                            elif col == "auth_required":
-                                funnel_violations_df[col] = False
-                            else:
-                                funnel_violations_df[col] = "none"
+                    if have_funnel_violations:
+                        # Colonne extra da garantire
+                        extra_cols = ["auth_required", "auth_strategy", "funnel_name", "funnel_step", "has_funnel_data"]
+                        for col in extra_cols:
+                            if col not in main_axe_df.columns:
+                                if col == "has_funnel_data":
+                                    main_axe_df[col] = False
+                                elif col == "auth_required":
+                                    main_axe_df[col] = False
+                                else:
+                                    main_axe_df[col] = "none"
+                            if col not in funnel_violations_df.columns:
+                                if col == "has_funnel_data":
+                                    funnel_violations_df[col] = True
+                                elif col == "auth_required":
+                                    funnel_violations_df[col] = False
+                                else:
+                                    funnel_violations_df[col] = "none"
 
-                    # Verifica compatibilità colonne
-                    if all(col in funnel_violations_df.columns for col in extra_cols):
-                        # Seleziona colonne comuni + quelle specifiche del funnel per mantenere l'informazione
-                        funnel_cols_to_keep = extra_cols + ['funnel_name', 'funnel_step', 'step_number', 'has_funnel_data']
-                        funnel_violations_df_filtered = funnel_violations_df[[col for col in funnel_cols_to_keep if col in funnel_violations_df.columns]].copy()
-                        combined_df_list = [main_axe_df]
-                        combined_df_list.append(funnel_violations_df_filtered)
-                    else:
-                        self.logger.warning("Il DataFrame delle violazioni funnel HTML non ha tutte le colonne richieste. Sarà ignorato.")
+                        # Verifica compatibilità colonne
+                        if all(col in funnel_violations_df.columns for col in extra_cols):
+                            # Seleziona colonne comuni + quelle specifiche del funnel per mantenere l'informazione
+                            funnel_cols_to_keep = extra_cols + ['funnel_name', 'funnel_step', 'step_number', 'has_funnel_data']
+                            funnel_violations_df_filtered = funnel_violations_df[[col for col in funnel_cols_to_keep if col in funnel_violations_df.columns]].copy()
+                            combined_df_list.append(funnel_violations_df_filtered)
+                        else:
+                            self.logger.warning("Il DataFrame delle violazioni funnel HTML non ha tutte le colonne richieste. Sarà ignorato.")
 
-                    # Concatena se ci sono dati funnel validi
+                    # Concatena se ci sono dati funnel validi, poi applica i metadati dei funnel
                     if len(combined_df_list) > 1:
                         combined_df = pd.concat(combined_df_list, ignore_index=True, sort=False)
                         self.logger.info(f"DataFrame combinato creato con {len(combined_df)} righe.")
+                    else:
+                        combined_df = main_axe_df
+                    combined_df = self._apply_funnel_metadata(combined_df, funnel_metadata)
 
-                        # Salva il DataFrame combinato in un nuovo file Excel temporaneo
+                    if len(combined_df_list) > 1 or funnel_metadata:
+                        # Salva il DataFrame risultante, una sola volta, in un nuovo file Excel temporaneo
                         temp_combined_excel = output_manager.get_path("analysis", f"temp_{output_manager.domain_slug}_combined_input.xlsx")
                         with pd.ExcelWriter(temp_combined_excel) as writer:
                             combined_df.to_excel(writer, index=False, sheet_name="CombinedData")
@@ -815,15 +845,11 @@ class Pipeline:
                 self.logger.exception(f"Errore durante l'esecuzione di AccessibilityAnalyzer.run_analysis: {e}")
                 return None
 
-        # Rimuovi il metodo helper _add_funnel_metadata_to_axe_results se non più necessario
-        # def _add_funnel_metadata_to_axe_results(self, ...):
-        #    pass
-      
     async def run_authentication(self, base_url: str, domain_config: Dict[str, Any], output_manager: OutputManager) -> Tuple[bool, List[str]]:
         """Initialize authentication and collect restricted URLs."""
         self.logger.info(f"Initializing authentication for {base_url}")
         
-        if not self.config_manager.get_bool("AUTH_ENABLED", False):
+        if not self._auth_enabled:
             self.logger.info(f"Authentication disabled for {base_url}")
             return False, []
             
@@ -904,7 +930,7 @@ class Pipeline:
         self.logger.info(f"Avvio analisi funnel per {base_url}")
         
         # Controlla se l'analisi dei funnel è abilitata
-        if not self.config_manager.get_bool("FUNNEL_ANALYSIS_ENABLED", False):
+        if not self._funnel_enabled:
             self.logger.info(f"Analisi funnel disabilitata per {base_url}")
             return {'enabled': False, 'funnels': {}}
                 
@@ -941,7 +967,7 @@ class Pipeline:
                 if hasattr(self.auth_manager.driver, 'quit'):
                     # Passa il driver esistente al funnel manager
                     if hasattr(self.funnel_manager, 'use_existing_driver'):
-                        self.funnel_manager.use_existing_driver(self.auth_manager.driver)
+                        self.funnel_manager.use_existing_driver(self.auth_manager.get_authenticated_driver())
                     else:
                         self.logger.warning("Metodo 'use_existing_driver' non trovato, verrà creato un nuovo driver")
                     
@@ -953,7 +979,7 @@ class Pipeline:
                         # Se l'autenticazione non è più valida, prova a riautenticarsi
                         if not is_still_auth:
                             self.logger.warning("Tentativo di ri-autenticazione prima di eseguire i funnel")
-                            auth_success = self.auth_manager.login()
+                            auth_success = self.auth_manager.login(force_refresh=True)
                             if not auth_success:
                                 self.logger.error("Ri-autenticazione fallita, i funnel potrebbero non funzionare correttamente")
                     else:
@@ -1050,60 +1076,29 @@ class Pipeline:
                 else:
                     self.logger.info("FunnelManager utilizza driver condiviso, non viene chiuso qui")
                     
-    def _add_funnel_metadata_to_axe_results(self, excel_path: Union[str, Path], funnel_metadata: Dict[str, Dict[str, Any]]) -> bool:
-        """Add funnel metadata to Axe Excel results."""
-        if not excel_path or not funnel_metadata:
-            return False
-            
-        try:
-            excel_path = Path(excel_path) if isinstance(excel_path, str) else excel_path
-            
-            if not excel_path.exists():
-                self.logger.warning(f"Excel file not found: {excel_path}")
-                return False
-                
-            self.logger.info(f"Adding funnel metadata to {excel_path}")
+    def _apply_funnel_metadata(self, df: pd.DataFrame, funnel_metadata: Dict[str, Dict[str, Any]]) -> pd.DataFrame:
+        """Tag rows of an in-memory Axe DataFrame with funnel metadata."""
+        if df.empty or 'page_url' not in df.columns or not funnel_metadata:
+            return df
             
-            xls = pd.ExcelFile(excel_path)
-            dfs = {}
+        # Add funnel columns
+        if 'funnel_name' not in df.columns:
+            df['funnel_name'] = 'none'
+        if 'funnel_step' not in df.columns:
+            df['funnel_step'] = 'none'
+        if 'has_funnel_data' not in df.columns:
+            df['has_funnel_data'] = False
             
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(xls, sheet_name=sheet_name)
+        # Match both exact URLs and URLs containing the funnel URL (more robust matching)
+        page_urls = df['page_url'].astype(str)
+        for url, metadata in funnel_metadata.items():
+            mask = page_urls.str.contains(url, regex=False)
+            if mask.any():
+                df.loc[mask, 'funnel_name'] = metadata.get('funnel_name', 'unknown')
+                df.loc[mask, 'funnel_step'] = metadata.get('funnel_step', 'unknown')
+                df.loc[mask, 'has_funnel_data'] = True
                 
-                if df.empty or 'page_url' not in df.columns:
-                    dfs[sheet_name] = df
-                    continue
-                    
-                # Add funnel columns
-                if 'funnel_name' not in df.columns:
-                    df['funnel_name'] = 'none'
-                if 'funnel_step' not in df.columns:
-                    df['funnel_step'] = 'none'
-                if 'has_funnel_data' not in df.columns:
-                    df['has_funnel_data'] = False
-                    
-                # Update rows with funnel information
-                for url, metadata in funnel_metadata.items():
-                    # Match both exact URLs and URLs containing the funnel URL (more robust matching)
-                    mask = df['page_url'].apply(lambda x: str(x) == url or url in str(x))
-                    if mask.any():
-                        df.loc[mask, 'funnel_name'] = metadata.get('funnel_name', 'unknown')
-                        df.loc[mask, 'funnel_step'] = metadata.get('funnel_step', 'unknown')
-                        df.loc[mask, 'has_funnel_data'] = True
-                        
-                dfs[sheet_name] = df
-            
-            # Write back to the Excel file
-            with pd.ExcelWriter(excel_path) as writer:
-                for sheet_name, df in dfs.items():
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    
-            self.logger.info(f"Successfully added funnel metadata to {excel_path}")
-            return True
-            
-        except Exception as e:
-            self.logger.exception(f"Error adding funnel metadata to Excel file: {e}")
-            return False
+        return df
         
     async def run_axe_analysis_on_urls(
         self, 
@@ -1191,8 +1186,17 @@ class Pipeline:
         # Create output manager
         output_manager = OutputManager(base_dir=OUTPUT_ROOT, domain=self.real_domain)
         
-        # Initialize authentication (don't login yet) and get restricted URLs 
-        auth_setup_success, restricted_urls = await self.run_authentication(base_url, domain_config, output_manager)
+        # Get pipeline configuration with standardized keys
+        start_stage = self._start_stage
+        phases = PHASE_PLAN.get(start_stage)
+        if phases is None:
+            self.logger.warning(f"Stage di partenza sconosciuto '{start_stage}', eseguo solo il report")
+            phases = PHASE_PLAN["report"]
+        
+        # Initialize authentication (don't login yet) and get restricted URLs, only if a later phase needs it
+        auth_setup_success, restricted_urls = False, []
+        if "axe" in phases or "funnel" in phases:
+            auth_setup_success, restricted_urls = await self.run_authentication(base_url, domain_config, output_manager)
         
         # Log the results for debugging
         if auth_setup_success:
@@ -1200,12 +1204,8 @@ class Pipeline:
             if restricted_urls:
                 self.logger.info(f"First few restricted URLs: {restricted_urls[:3]}")
         
-        # Get pipeline configuration with standardized keys
-        start_stage = self.pipeline_config.get("start_stage") or self.config_manager.get("START_STAGE", "crawler")
-        repeat_axe = self.pipeline_config.get("repeat_axe") or self.config_manager.get_int("REPEAT_ANALYSIS", 1)
-        
         # Run crawler if starting from that phase
-        if start_stage == "crawler":
+        if "crawler" in phases:
             self.logger.info(f"Starting from crawler phase for {base_url}")
             try:
                 crawler_success = await self.run_crawler(base_url, domain_config, output_manager)
@@ -1223,7 +1223,7 @@ class Pipeline:
             self.logger.info(f"Skipping crawler phase for {base_url} (starting from {start_stage})")
 
         # Run standard accessibility analysis
-        if start_stage in ["crawler", "auth", "axe"]:
+        if "axe" in phases:
             # Standard analysis without authentication
             await self.run_axe_analysis(base_url, domain_config, output_manager)
             
@@ -1267,7 +1267,7 @@ class Pipeline:
         funnel_violations_df = None
         html_files_found = False
         
-        if start_stage in ["crawler", "auth", "axe", "funnel"]:
+        if "funnel" in phases:
             funnel_analysis_result = await self.run_funnel_analysis(base_url, domain_config, output_manager)
             
             # Check if analysis is enabled
@@ -1283,17 +1283,9 @@ class Pipeline:
                     self.logger.warning("No HTML files were found from funnel execution")
 
         # Generate final report with all data
-        if not self.shutdown_flag:
+        if "report" in phases and not self.shutdown_flag:
             try:
-                # Add funnel metadata to main results if any found
-                if funnel_metadata:
-                    self._add_funnel_metadata_to_axe_results(
-                        output_manager.get_path("axe", f"accessibility_report_{output_manager.domain_slug}.xlsx"),
-                        funnel_metadata
-                    )
-                    self.logger.info("Added funnel metadata to accessibility report")
-                
-                # Generate final report - IMPORTANT: We do this even if the funnel failed but produced HTML
+                # Generate final report (funnel metadata is applied in memory, without rewriting the Axe report) - IMPORTANT: We do this even if the funnel failed but produced HTML
                 have_funnel_data = funnel_violations_df is not None and not funnel_violations_df.empty
                 
                 # Log status before report generation
@@ -1337,30 +1329,32 @@ class Pipeline:
         for url in base_urls:
             self.logger.info(f"  - {url}")
         
-        # Avvia task di monitoraggio risorse
-        monitor_task = asyncio.create_task(self.monitor_resources())
-        
-        # Processa tutti gli URL
+        # Processa tutti gli URL con il monitoraggio risorse in background; un errore
+        # del monitor non deve interrompere l'elaborazione degli URL
         results = []
-        for url in base_urls:
-            if self.shutdown_flag:
-                self.logger.warning("Interruzione richiesta, arresto elaborazione")
-                break
-                
+        monitor_task = asyncio.create_task(self.monitor_resources())
+        try:
+            for url in base_urls:
+                if self.shutdown_flag:
+                    self.logger.warning("Interruzione richiesta, arresto elaborazione")
+                    break
+                    
+                try:
+                    report_path = await self.process_url(url)
+                    if report_path:
+                        results.append(report_path)
+                except Exception as e:
+                    self.logger.error(f"Errore elaborando {url}: {e}")
+                    self.logger.error(traceback.format_exc())
+        finally:
+            # Ferma monitoraggio risorse e attendi la sua terminazione
+            monitor_task.cancel()
             try:
-                report_path = await self.process_url(url)
-                if report_path:
-                    results.append(report_path)
+                await monitor_task
+            except asyncio.CancelledError:
+                pass
             except Exception as e:
-                self.logger.error(f"Errore elaborando {url}: {e}")
-                self.logger.error(traceback.format_exc())
-        
-        # Ferma monitoraggio risorse
-        monitor_task.cancel()
-        try:
-            await monitor_task
-        except asyncio.CancelledError:
-            pass
+                self.logger.error(f"Monitor risorse terminato con errore: {e}")
             
         return results
     
@@ -1385,7 +1379,7 @@ class Pipeline:
                 self.funnel_manager.close()
             
             # Invia report via email se configurato
-            if report_paths and self.config_manager.get_bool("SEND_EMAIL", False):
+            if report_paths and self._send_email:
                 email_config = self.config_manager.get_email_config()
                 recipient = email_config.get("recipient_email")
                 
@@ -1416,11 +1410,11 @@ class Pipeline:
             self.logger.exception(f"Errore fatale durante l'esecuzione del pipeline: {e}")
             return 2
 
-async def main():
-    """Entry point del programma con supporto per parametri CLI."""
+@lru_cache(maxsize=1)
+def _get_arg_parser():
+    """Crea il parser per gli argomenti da linea di comando, una sola volta e solo quando serve."""
     import argparse
     
-    # Crea parser per argomenti da linea di comando
     parser = argparse.ArgumentParser(description='Pipeline di analisi accessibilità axeScraper')
     parser.add_argument('--config', '-c', help='File di configurazione')
     parser.add_argument('--domains', '-d', help='Domini da analizzare (separati da virgola)')
@@ -1428,29 +1422,55 @@ async def main():
                         help='Stadio iniziale del pipeline')
     parser.add_argument('--max-urls', '-m', type=int, help='Numero massimo di URL per dominio')
     parser.add_argument('--debug', action='store_true', help='Attiva modalità debug')
-    
+    return parser
+
+async def main():
+    """Entry point del programma con supporto per parametri CLI."""
     # Elabora gli argomenti
-    args = parser.parse_args()
+    args = _get_arg_parser().parse_args()
     
     # Converti argomenti in un dizionario per ConfigurationManager
-    cli_args = {}
-    if args.domains:
-        cli_args['BASE_URLS'] = args.domains
-    if args.start:
-        cli_args['START_STAGE'] = args.start
-    if args.max_urls:
-        cli_args['CRAWLER_MAX_URLS'] = args.max_urls
-    if args.debug:
-        cli_args['DEBUG'] = True
+    cli_args = {
+        key: value for key, value in {
+            'BASE_URLS': args.domains,
+            'START_STAGE': args.start,
+            'CRAWLER_MAX_URLS': args.max_urls,
+            'DEBUG': args.debug or None,
+        }.items() if value
+    }
     
     # Inizializza e avvia pipeline
     pipeline = Pipeline(config_file=args.config, cli_args=cli_args)
     exit_code = await pipeline.run()
     return exit_code
 
+def _event_loop_factory():
+    """
+    Restituisce la factory dell'event loop: uvloop se abilitato tramite
+    AXESCRAPER_UVLOOP=1 e installato, altrimenti None (loop standard).
+    """
+    if os.environ.get("AXESCRAPER_UVLOOP", "0").lower() not in ("1", "true", "yes", "y", "on"):
+        return None
+    try:
+        import uvloop
+        return uvloop.new_event_loop
+    except ImportError:
+        # Logger del pipeline: se non ancora configurato, l'avviso arriva comunque su stderr
+        logging.getLogger("pipeline").warning("AXESCRAPER_UVLOOP attivo ma uvloop non è installato, uso l'event loop standard")
+        return None
+
 if __name__ == "__main__":
     try:
-        exit_code = asyncio.run(main())
+        loop_factory = _event_loop_factory()
+        if hasattr(asyncio, "Runner"):
+            # Python 3.11+: loop_factory senza toccare la policy globale
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                exit_code = runner.run(main())
+        else:
+            if loop_factory is not None:
+                import uvloop
+                uvloop.install()
+            exit_code = asyncio.run(main())
         exit(exit_code)
     except KeyboardInterrupt:
         print("Pipeline interrotto dall'utente")
@@ -7,30 +7,173 @@ Supports multiple authentication strategies including form-based and HTTP Basic.
 """
 
 import logging
+import os
+import re
+import atexit
+import json
 import time
 import base64
+import threading
+import weakref
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html.parser import HTMLParser
+from urllib.parse import urlparse, urlunparse
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from typing import Dict, Any, Optional, List, Union
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Sequence, Set, Tuple, Union
 
 from utils.logging_config import get_logger
 from utils.config_manager import ConfigurationManager
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
+
+# Selenium is imported by _import_selenium() the first time a driver is built
+# or waited on, so runs without authentication never pay for its import graph
+_selenium_loaded = False
+
+def _import_selenium() -> None:
+    """Bind the Selenium names used by this module, importing Selenium once."""
+    global _selenium_loaded, webdriver, By, WebDriverWait, EC
+    global TimeoutException, StaleElementReferenceException
+    if _selenium_loaded:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+    _selenium_loaded = True
+
+class _HiddenInputParser(HTMLParser):
+    """Collect name/value pairs of hidden inputs (e.g. CSRF tokens) from a login page."""
+    
+    def __init__(self):
+        super().__init__()
+        self.fields = {}
+        
+    def handle_starttag(self, tag, attrs):
+        if tag != "input":
+            return
+        attributes = dict(attrs)
+        if (attributes.get("type") or "").lower() == "hidden" and attributes.get("name"):
+            self.fields[attributes["name"]] = attributes.get("value") or ""
+
 class AuthenticationManager:
     """
     Manager for website authentication using multiple strategies.
     Supports form-based authentication, HTTP Basic, and session management.
     """
     
+    # Action types that can be executed together in one execute_script call
+    _BATCHABLE_ACTIONS = frozenset(("click", "input", "script"))
+    
+    # Runs the batched steps in order and returns [index, started] for the first
+    # step that did not complete, or null if all of them succeeded. started is
+    # false when the step's element was missing, hidden or disabled (nothing ran),
+    # true when the step threw. window.__axeBatchStep records the step in progress.
+    _BATCH_ACTIONS_SCRIPT = """
+    var steps = arguments[0];
+    window.__axeBatchStep = -1;
+    for (var i = 0; i < steps.length; i++) {
+        var step = steps[i];
+        if (step.type !== 'script') {
+            var el = document.querySelector(step.selector);
+            if (!el || el.getClientRects().length === 0 || (step.type === 'click' && el.disabled)) {
+                return [i, false];
+            }
+        }
+        window.__axeBatchStep = i;
+        try {
+            if (step.type === 'script') {
+                (new Function(step.code))();
+            } else if (step.type === 'click') {
+                el.click();
+            } else {
+                el.focus();
+                el.value = step.value;
+                el.dispatchEvent(new Event('input', {bubbles: true}));
+                el.dispatchEvent(new Event('change', {bubbles: true}));
+            }
+        } catch (e) {
+            return [i, true];
+        }
+    }
+    return null;
+    """
+    
+    # Idle authentication drivers shared across instances, keyed by headless
+    # mode and Chrome arguments
+    _driver_pool: "Dict[tuple, List[webdriver.Chrome]]" = {}
+    _driver_pool_lock = threading.Lock()
+    
+    # Managers with a started driver, tracked weakly so that closing them at
+    # interpreter exit does not keep them alive until then
+    _live_managers: "weakref.WeakSet[AuthenticationManager]" = weakref.WeakSet()
+    
+    # Sets an input's value via the native setter and fires input/change events
+    _SET_FIELD_JS = (
+        "var e=arguments[0];e.focus();"
+        "Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e),'value').set.call(e,arguments[1]);"
+        "e.dispatchEvent(new Event('input',{bubbles:true}));"
+        "e.dispatchEvent(new Event('change',{bubbles:true}));"
+    )
+    
+    # HTTP status of the current document from Navigation Timing (Chrome 109+);
+    # 0 or undefined when the browser does not expose it
+    _NAVIGATION_STATUS_JS = (
+        "var n=performance.getEntriesByType('navigation')[0];return n?n.responseStatus:0;"
+    )
+    
+    # Upper bound of the per-instance URL -> classification cache
+    _CLASSIFY_CACHE_SIZE = 4096
+    
+    # Cookie attributes accepted by Selenium's add_cookie
+    _COOKIE_KEYS = frozenset(("name", "value", "domain", "path", "expiry", "secure", "httpOnly"))
+    # Same attributes for CDP Network.setCookies, which also takes sameSite
+    # and names the expiry "expires"
+    _CDP_COOKIE_KEYS = frozenset(("name", "value", "domain", "path", "secure", "httpOnly", "sameSite"))
+    
+    _COOKIE_BUTTON_SELECTOR = (
+        'button[id*="cookie"], button[class*="cookie"], button[id*="consent"], '
+        'button[class*="consent"], #onetrust-accept-btn-handler'
+    )
+    
+    # Clicks the first visible consent button; returns true if one was clicked.
+    # Built once, minified, with the selector inlined
+    _COOKIE_BANNER_JS = (
+        "var b=document.querySelectorAll(%s);"
+        "for(var i=0;i<b.length;i++){if(b[i].offsetParent!==null){b[i].click();return true;}}"
+        "return false;" % json.dumps(_COOKIE_BUTTON_SELECTOR)
+    )
+    
+    # Installed once per driver: dismisses consent banners on every new document
+    # as soon as they are added to the DOM
+    _COOKIE_BANNER_OBSERVER_JS = (
+        "(function(){var dismiss=function(){%s};"
+        "var o=new MutationObserver(function(){if(dismiss()){o.disconnect();}});"
+        "document.addEventListener('DOMContentLoaded',function(){"
+        "if(!dismiss()){o.observe(document.body,{childList:true,subtree:true});}});})();"
+        % _COOKIE_BANNER_JS
+    )
+    
     def __init__(
         self,
         config_manager: Optional[ConfigurationManager] = None,
         domain: Optional[str] = None,
-        output_manager = None
+        output_manager = None,
+        cookie_store_path: Optional[Union[str, Path]] = None,
+        driver: "Optional[webdriver.Chrome]" = None
     ):
         """
         Initialize the authentication manager.
@@ -39,32 +182,166 @@ class AuthenticationManager:
             config_manager: Configuration manager instance
             domain: Target domain for authentication
             output_manager: Output manager for managing files and directories
+            cookie_store_path: Path of the JSON cookie checkpoint
+                (default AUTH_COOKIE_STORE; no checkpoint when empty)
+            driver: Existing browser to log in with; it is shared, not closed
         """
-        self.config_manager = config_manager or ConfigurationManager(project_name="axeScraper")
+        self.config_manager = config_manager or ConfigurationManager.get_instance("axeScraper")
         self.domain = domain
         self.output_manager = output_manager
         
-        # Setup logger
-        self.logger = get_logger("auth_manager", 
-                           self.config_manager.get_logging_config()["components"].get("auth_manager", {}),
-                           output_manager,
-                           domain=self.domain)
+        self._cookie_store_arg = cookie_store_path
         
-        # Load auth configuration
-        self.auth_config = self._load_auth_config()
+        # Logger, auth configuration and URL matchers are built lazily on first
+        # access (see the cached properties below), so unused managers are cheap
         
         # Initialize state
-        self.driver = None
+        self.driver = driver
+        self._owns_driver = driver is None
         self.is_authenticated = False
         self.cookies = None
         self.authenticated_urls = []
+        self._driver_key = None
+        self._driver_handed_out = False
+        self._wait_obj = None
+        self._init_lock = threading.Lock()
+        self._classify_cache = {}
+        self._screenshots_dir_ready = False
+        self._screenshot_pool = None
         
-        # HTTP Basic credentials
-        self.http_basic_credentials = None
-        if "http_basic" in self.auth_config.get("strategies", []):
-            self._initialize_http_basic()
+        # Action type -> handler used by perform_action
+        self._action_handlers = {
+            "wait": self._act_wait,
+            "click": self._act_click,
+            "input": self._act_input,
+            "screenshot": self._act_screenshot,
+            "script": self._act_script,
+            "cookie_banner": self._act_cookie_banner
+        }
+        
+        # Cookie checkpoint used to skip the Selenium login on restarts
+        self.cookie_ttl = self.config_manager.get_int("AUTH_COOKIE_TTL", 3600)
+    
+    @cached_property
+    def logger(self) -> logging.Logger:
+            """Component logger, created on first use."""
+            return get_logger("auth_manager", 
+                              self.config_manager.get_logging_config()["components"].get("auth_manager", {}),
+                              self.output_manager,
+                              domain=self.domain)
+    
+    @cached_property
+    def auth_config(self) -> Dict[str, Any]:
+            """Authentication configuration, loaded on first use."""
+            return self._load_auth_config()
+    
+    @cached_property
+    def domain_slug(self) -> Optional[str]:
+            """Slug of the target domain as used in AUTH_DOMAINS."""
+            return self.config_manager.domain_to_slug(self.domain) if self.domain else None
+    
+    @cached_property
+    def _domain_table(self) -> Dict[str, Dict[str, Any]]:
+            """AUTH_DOMAINS keyed by slug, plus the same entries keyed by slug without underscores."""
+            domains = self.auth_config["domains"]
+            table = {slug.replace("_", ""): config for slug, config in domains.items()}
+            table.update(domains)
+            return table
+    
+    @cached_property
+    def domain_auth_config(self) -> Optional[Dict[str, Any]]:
+            """AUTH_DOMAINS entry of the target domain, also matched by its underscore-free slug."""
+            if not self.domain_slug:
+                return None
+            config = self._domain_table.get(self.domain_slug)
+            if config is None:
+                config = self._domain_table.get(self.domain_slug.replace("_", ""))
+            return config
+    
+    @cached_property
+    def _restricted_prefixes(self) -> tuple:
+            """Restricted URL prefixes configured for the target domain."""
+            if not self.domain_auth_config:
+                return ()
+            return tuple(self.domain_auth_config.get("restricted_urls", []))
+    
+    @cached_property
+    def _restricted_url_re(self) -> Optional["re.Pattern"]:
+            """
+            Single regex matching restricted URLs, or None if nothing is restricted.
         
-        self.logger.info("Authentication Manager initialized")
+            Restricted URLs are anchored at the start of the URL, while
+            RESTRICTED_AREA_PATTERNS may appear anywhere in it.
+            """
+            alternatives = []
+            if self._restricted_prefixes:
+                alternatives.append(r"\A(?:%s)" % "|".join(map(re.escape, self._restricted_prefixes)))
+            restricted_patterns = self.config_manager.get_list("RESTRICTED_AREA_PATTERNS", [])
+            if restricted_patterns:
+                alternatives.append("|".join(map(re.escape, restricted_patterns)))
+            if not alternatives:
+                return None
+            return re.compile("|".join(alternatives))
+    
+    @cached_property
+    def cookie_store_path(self) -> Optional[Path]:
+            """Path of the JSON cookie checkpoint, or None when checkpointing is disabled."""
+            store_path = self._cookie_store_arg or self.config_manager.get("AUTH_COOKIE_STORE", "")
+            return Path(store_path).expanduser() if store_path else None
+    
+    @cached_property
+    def http_basic_credentials(self) -> Optional[str]:
+            """HTTP Basic Authorization header value, or None if not configured."""
+            if "http_basic" not in self.auth_config.get("strategies", []):
+                return None
+            return self._initialize_http_basic()
+    
+    @cached_property
+    def _parsed_login(self):
+            """Parsed login URL, or None if no login URL is configured."""
+            login_url = self.auth_config.get("login_url")
+            return urlparse(login_url) if login_url else None
+    
+    @cached_property
+    def _base_url(self) -> str:
+            """Origin of the login URL, where the session cookies are scoped."""
+            if not self._parsed_login:
+                return ""
+            return f"{self._parsed_login.scheme}://{self._parsed_login.netloc}"
+    
+    @cached_property
+    def _basic_auth_headers(self) -> Dict[str, str]:
+            """Extra HTTP headers carrying the HTTP Basic credentials, built once."""
+            return {"Authorization": self.http_basic_credentials} if self.http_basic_credentials else {}
+    
+    @cached_property
+    def debug_screenshots(self) -> bool:
+            """Whether the login flow saves debugging screenshots (AUTH_DEBUG_SCREENSHOTS)."""
+            return self.config_manager.get_bool("AUTH_DEBUG_SCREENSHOTS", False)
+    
+    @cached_property
+    def wait_timeout(self) -> int:
+            """Default explicit wait timeout in seconds (AUTH_WAIT_TIMEOUT)."""
+            return self.config_manager.get_int("AUTH_WAIT_TIMEOUT", 20)
+    
+    @cached_property
+    def poll_interval(self) -> float:
+            """Seconds between explicit wait polls (AUTH_POLL_INTERVAL)."""
+            return self.config_manager.get_float("AUTH_POLL_INTERVAL", 0.1)
+    
+    @property
+    def _wait(self) -> "WebDriverWait":
+            """Explicit wait reused by actions and login steps, built on first use."""
+            if self._wait_obj is None or self._wait_obj._driver is not self.driver:
+                self._wait_obj = self._make_wait()
+            return self._wait_obj
+    
+    def _make_wait(self, timeout: Optional[float] = None, driver=None) -> "WebDriverWait":
+            """Explicit wait on driver (default self.driver) polling every poll_interval."""
+            _import_selenium()
+            return WebDriverWait(driver or self.driver,
+                                 self.wait_timeout if timeout is None else timeout,
+                                 poll_frequency=self.poll_interval)
     
     def _load_auth_config(self) -> Dict[str, Any]:
         """
@@ -88,7 +365,9 @@ class AuthenticationManager:
             "post_login_actions": self.config_manager.get("AUTH_POST_LOGIN_ACTIONS", []),
             "domains": self.config_manager.get("AUTH_DOMAINS", {}),
             "http_basic_username": self.config_manager.get("AUTH_BASIC_USERNAME", ""),
-            "http_basic_password": self.config_manager.get("AUTH_BASIC_PASSWORD", "")
+            "http_basic_password": self.config_manager.get("AUTH_BASIC_PASSWORD", ""),
+            "http_username_field": self.config_manager.get("AUTH_HTTP_USERNAME_FIELD", "username"),
+            "http_password_field": self.config_manager.get("AUTH_HTTP_PASSWORD_FIELD", "password")
         }
         
         # Log available strategies
@@ -104,6 +383,12 @@ class AuthenticationManager:
                     if not auth_config[field]:
                         missing_fields.append(field)
             
+            # Validate HTTP form auth if enabled
+            if "http_form" in auth_config["strategies"]:
+                for field in ["login_url", "username", "password"]:
+                    if not auth_config[field] and field not in missing_fields:
+                        missing_fields.append(field)
+            
             # Validate HTTP Basic auth if enabled
             if "http_basic" in auth_config["strategies"]:
                 for field in ["http_basic_username", "http_basic_password"]:
@@ -115,106 +400,78 @@ class AuthenticationManager:
         
         return auth_config
     
-    def apply_auth_to_driver(self, driver: webdriver.Chrome) -> bool:
-        """Apply authentication cookies to another Selenium driver."""
-        if not self.is_authenticated or not self.cookies:
-            self.logger.warning("Cannot apply authentication - not authenticated or no cookies")
-            return False
-            
-        try:
-            # Get current URL to return to it after setting cookies
-            current_url = driver.current_url
-            
-            # Extract domain from login URL to set cookies
-            main_domain = self.auth_config["login_url"].split("//")[1].split("/")[0]
-            
-            # Need to visit the domain before setting cookies
-            driver.get(f"https://{main_domain}")
-            
-            # Log all cookies for debugging
-            self.logger.info(f"Applying {len(self.cookies)} cookies to driver")
-            for cookie in self.cookies:
-                self.logger.info(f"Cookie: {cookie['name']} = {cookie['value']} (domain: {cookie.get('domain', 'N/A')})")
-            
-            # Try multiple domain formats to ensure cookie compatibility
-            cookie_domains_tried = set()
-            
-            # Add each cookie to the driver
-            for cookie in self.cookies:
-                try:
-                    # Make a copy to avoid modifying the original
-                    cookie_copy = cookie.copy()
-                    
-                    # Remove problematic cookie attributes
-                    if 'expiry' in cookie_copy:
-                        cookie_copy['expiry'] = int(cookie_copy['expiry'])
-                    
-                    for attr in ['sameSite', 'priority', 'storeId', 'hostOnly']:
-                        if attr in cookie_copy:
-                            del cookie_copy[attr]
-                    
-                    # Track the domain we're setting
-                    if 'domain' in cookie_copy:
-                        cookie_domains_tried.add(cookie_copy['domain'])
-                    
-                    # Set the cookie
-                    driver.add_cookie(cookie_copy)
-                    
-                    # Also try with other domain formats if domain is specified
-                    if 'domain' in cookie and cookie['domain']:
-                        original_domain = cookie['domain']
-                        
-                        # Try with and without www and with/without leading dot
-                        alternate_domains = []
-                        if original_domain.startswith('www.'):
-                            alternate_domains.append(original_domain[4:])  # Remove www
-                            alternate_domains.append('.' + original_domain[4:])  # Add dot, remove www
-                        elif original_domain.startswith('.www.'):
-                            alternate_domains.append(original_domain[5:])  # Remove .www
-                            alternate_domains.append('.' + original_domain[5:])  # Change .www. to .
-                        else:
-                            if not original_domain.startswith('.'):
-                                alternate_domains.append('.' + original_domain)  # Add leading dot
-                            alternate_domains.append('www.' + original_domain.lstrip('.'))  # Add www
-                        
-                        # Try each alternate domain
-                        for alt_domain in alternate_domains:
-                            if alt_domain in cookie_domains_tried:
-                                continue
-                                
-                            try:
-                                alt_cookie = cookie_copy.copy()
-                                alt_cookie['domain'] = alt_domain
-                                driver.add_cookie(alt_cookie)
-                                cookie_domains_tried.add(alt_domain)
-                                self.logger.info(f"Added cookie with alternate domain: {alt_domain}")
-                            except Exception as domain_e:
-                                self.logger.debug(f"Could not set cookie with alternate domain {alt_domain}: {domain_e}")
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error adding cookie: {e}")
-            
-            # Also transfer localStorage and sessionStorage if available
-            self._transfer_storage_state(driver)
-            
-            # Verify the cookies were set
-            all_cookies = driver.get_cookies()
-            self.logger.info(f"Driver now has {len(all_cookies)} cookies after auth transfer")
-            
-            # Refresh the page to apply cookies
-            driver.refresh()
+    def _load_cookie_checkpoint(self) -> bool:
+            """
+            Load cookies from the checkpoint file if it is still fresh.
+        
+            Returns:
+                True if valid cookies were loaded into self.cookies
+            """
+            if self.cookie_ttl <= 0 or self.cookie_store_path is None or not self.cookie_store_path.exists():
+                return False
             
-            # Return to original URL
-            driver.get(current_url)
+            try:
+                age = time.time() - self.cookie_store_path.stat().st_mtime
+                if age > self.cookie_ttl:
+                    self.logger.info(f"Cookie checkpoint expired ({age:.0f}s old): {self.cookie_store_path}")
+                    return False
+                
+                with open(self.cookie_store_path, 'rb') as f:
+                    cookies = _json_loads(f.read())
+                
+                # Drop cookies that expired since the checkpoint was written
+                now = time.time()
+                cookies = [c for c in cookies if not c.get("expiry") or c["expiry"] >= now]
+                if not cookies:
+                    return False
+                
+                self.cookies = cookies
+                self.logger.info(f"Loaded {len(cookies)} cookies from checkpoint {self.cookie_store_path}")
+                return True
             
-            self.logger.info(f"Authentication applied to driver, visiting: {current_url}")
-            return True
+            except Exception as e:
+                self.logger.warning(f"Error loading cookie checkpoint: {e}")
+                return False
+    
+    def _save_cookie_checkpoint(self) -> None:
+            """Atomically write the current cookies to the checkpoint file, readable by the owner only."""
+            if self.cookie_ttl <= 0 or self.cookie_store_path is None or not self.cookies:
+                return
             
-        except Exception as e:
-            self.logger.error(f"Error applying authentication to driver: {e}")
-            return False
-
-    def _transfer_storage_state(self, driver: webdriver.Chrome) -> None:
+            tmp_path = self.cookie_store_path.with_suffix(".tmp")
+            try:
+                self.cookie_store_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                # A leftover temp file keeps its old mode: tighten it explicitly
+                os.fchmod(fd, 0o600)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(self.cookies))
+                os.replace(tmp_path, self.cookie_store_path)
+                self.logger.info(f"Cookie checkpoint saved to {self.cookie_store_path}")
+            except Exception as e:
+                self.logger.warning(f"Error saving cookie checkpoint: {e}")
+    
+    @classmethod
+    def _clean_cookie(cls, cookie: Dict[str, Any]) -> Dict[str, Any]:
+            """Return a copy of a cookie with only the attributes Selenium accepts."""
+            clean = {key: cookie[key] for key in cls._COOKIE_KEYS if key in cookie}
+            if "expiry" in clean:
+                # Selenium requires an integer expiry
+                clean["expiry"] = int(clean["expiry"])
+            return clean
+    
+    @classmethod
+    def _cdp_cookie(cls, cookie: Dict[str, Any], url: str) -> Dict[str, Any]:
+            """Convert a Selenium cookie to a CDP Network.CookieParam."""
+            param = {key: cookie[key] for key in cls._CDP_COOKIE_KEYS if key in cookie}
+            if "expiry" in cookie:
+                param["expires"] = float(cookie["expiry"])
+            if "domain" not in param:
+                # CDP needs either a domain or a URL to scope the cookie
+                param["url"] = url
+            return param
+    
+    def _transfer_storage_state(self, driver: "webdriver.Chrome") -> None:
         """Transfer localStorage and sessionStorage state."""
         if not self.driver:
             return
@@ -257,8 +514,8 @@ class AuthenticationManager:
         except Exception as e:
             self.logger.warning(f"Error transferring storage state: {e}")
     
-    def _initialize_http_basic(self) -> None:
-            """Initialize HTTP Basic authentication credentials."""
+    def _initialize_http_basic(self) -> Optional[str]:
+            """Build the HTTP Basic authentication header value."""
             username = self.auth_config.get("http_basic_username", "")
             password = self.auth_config.get("http_basic_password", "")
             
@@ -266,10 +523,11 @@ class AuthenticationManager:
                 # Create HTTP Basic auth header string
                 auth_string = f"{username}:{password}"
                 encoded_auth = base64.b64encode(auth_string.encode()).decode()
-                self.http_basic_credentials = f"Basic {encoded_auth}"
                 self.logger.info("HTTP Basic authentication credentials initialized")
-            else:
-                self.logger.warning("Missing HTTP Basic authentication credentials")
+                return f"Basic {encoded_auth}"
+                
+            self.logger.warning("Missing HTTP Basic authentication credentials")
+            return None
     
     def is_auth_required(self, url: str) -> bool:
             """
@@ -281,26 +539,7 @@ class AuthenticationManager:
             Returns:
                 True if the URL requires authentication
             """
-            if not self.auth_config["enabled"]:
-                return False
-                
-            # Check if URL is in restricted areas
-            domain_slug = self.config_manager.domain_to_slug(self.domain) if self.domain else None
-            
-            if domain_slug and domain_slug in self.auth_config["domains"]:
-                # Check restricted URLs for this domain
-                restricted_urls = self.auth_config["domains"][domain_slug].get("restricted_urls", [])
-                for restricted_url in restricted_urls:
-                    if url.startswith(restricted_url):
-                        return True
-            
-            # Check URL against restricted patterns
-            restricted_patterns = self.config_manager.get_list("RESTRICTED_AREA_PATTERNS", [])
-            for pattern in restricted_patterns:
-                if pattern in url:
-                    return True
-                    
-            return False
+            return self._classify(url)[0]
     
     def get_auth_strategy_for_url(self, url: str) -> str:
             """
@@ -312,27 +551,85 @@ class AuthenticationManager:
             Returns:
                 Authentication strategy to use ('form', 'http_basic', or None)
             """
-            if not self.auth_config["enabled"] or not self.is_auth_required(url):
-                return None
+            return self._classify(url)[1]
+    
+    def _classify(self, url: str) -> Tuple[bool, Optional[str]]:
+            """
+            Classify a URL once for both is_auth_required and get_auth_strategy_for_url.
+            
+            Args:
+                url: URL to check
+                
+            Returns:
+                Tuple (auth required, strategy or None), memoized per URL
+            """
+            try:
+                return self._classify_cache[url]
+            except KeyError:
+                pass
+                
+            if len(self._classify_cache) >= self._CLASSIFY_CACHE_SIZE:
+                self._classify_cache.clear()
+            result = self._classify_cache[url] = self._classify_uncached(url)
+            return result
+    
+    def _classify_uncached(self, url: str) -> Tuple[bool, Optional[str]]:
+            """Compute the (required, strategy) pair for a URL with a single regex scan."""
+            if not self.auth_config["enabled"]:
+                return False, None
+                
+            # Restricted URL prefixes and patterns are matched by one compiled regex
+            if self._restricted_url_re is None or self._restricted_url_re.search(url) is None:
+                return False, None
                 
             # Check for domain-specific strategy
-            domain_slug = self.config_manager.domain_to_slug(self.domain) if self.domain else None
-            if domain_slug and domain_slug in self.auth_config["domains"]:
-                domain_strategy = self.auth_config["domains"][domain_slug].get("auth_strategy")
+            if self.domain_auth_config:
+                domain_strategy = self.domain_auth_config.get("auth_strategy")
                 if domain_strategy:
                     if domain_strategy == "combined":
                         # For combined strategy, use HTTP Basic for URLs with /api/ and form for others
-                        if "/api/" in url:
-                            return "http_basic"
-                        else:
-                            return "form"
-                    return domain_strategy
+                        return True, "http_basic" if "/api/" in url else "form"
+                    return True, domain_strategy
                     
             # Default to the first strategy in the list
             if self.auth_config["strategies"]:
-                return self.auth_config["strategies"][0]
+                return True, self.auth_config["strategies"][0]
                 
-            return None
+            return True, None
+    
+    def _build_driver_options(self, headless: bool = True) -> "webdriver.ChromeOptions":
+            """
+            Build the Chrome options shared by the authentication drivers.
+            
+            Args:
+                headless: Whether to run the browser in headless mode
+                
+            Returns:
+                Configured ChromeOptions
+            """
+            _import_selenium()
+            options = webdriver.ChromeOptions()
+            if headless:
+                options.add_argument("--headless")
+                
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--window-size=1920,1080")
+            
+            # Images and notifications are irrelevant to logging in; stylesheets stay
+            # enabled because visibility checks on the indicators depend on them
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2
+            })
+            # Return from driver.get on DOMContentLoaded, explicit waits handle the rest
+            options.page_load_strategy = "eager"
+            
+            # HTTP Basic credentials are not a browser switch: they are sent through the
+            # credentialed URL in perform_http_basic_auth or the CDP Authorization header
+            return options
     
     def initialize_driver(self, headless: bool = True) -> None:
             """
@@ -344,52 +641,35 @@ class AuthenticationManager:
             if self.driver is not None:
                 return
                 
-            self.logger.info("Initializing authentication driver")
+            # Double-checked under the lock so concurrent callers start a single Chrome
+            with self._init_lock:
+                if self.driver is not None:
+                    return
+                    
+                self.logger.info("Initializing authentication driver")
             
-            try:
-                options = webdriver.ChromeOptions()
-                if headless:
-                    options.add_argument("--headless")
+                try:
+                    options = self._build_driver_options(headless)
+                    self._driver_key = (headless, tuple(options.arguments))
+                    driver = self._acquire_driver(self._driver_key)
+                    if driver is not None:
+                        self.logger.info("Reusing pooled authentication driver")
+                    else:
+                        # Keep the chromedriver command connection alive between calls
+                        driver = webdriver.Chrome(options=options, keep_alive=True)
                     
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-gpu")
-                options.add_argument("--window-size=1920,1080")
-                
-                # Add HTTP Basic authentication directly to Chrome if needed
-                if "http_basic" in self.auth_config["strategies"]:
-                    username = self.auth_config.get("http_basic_username", "")
-                    password = self.auth_config.get("http_basic_password", "")
-                    if username and password:
-                        # Add command line switch for HTTP Basic auth
-                        if self.domain:
-                            # Extract the base domain for auth
-                            from urllib.parse import urlparse
-                            if self.domain.startswith(('http://', 'https://')):
-                                parsed = urlparse(self.domain)
-                                base_domain = parsed.netloc
-                            else:
-                                # Try to extract domain directly
-                                if '/' in self.domain:
-                                    base_domain = self.domain.split('/', 1)[0]
-                                else:
-                                    base_domain = self.domain
-                                    
-                            # Remove www. if present
-                            if base_domain.startswith('www.'):
-                                base_domain = base_domain[4:]
-                                
-                            auth_switch = f'--host-resolver-rules="MAP * {base_domain}, EXCLUDE localhost"'
-                            options.add_argument(auth_switch)
-                        
-                self.driver = webdriver.Chrome(options=options)
-                self.driver.implicitly_wait(10)
+                    # The driver is published last so the unlocked check never
+                    # sees it half set up
+                    self.driver = driver
                 
-                self.logger.info("Authentication driver initialized successfully")
+                    # Second line of defense against orphaned Chrome processes
+                    self._live_managers.add(self)
                 
-            except Exception as e:
-                self.logger.error(f"Error initializing authentication driver: {e}")
-                raise
+                    self.logger.info("Authentication driver initialized successfully")
+                
+                except Exception as e:
+                    self.logger.error(f"Error initializing authentication driver: {e}")
+                    raise
     
     def perform_action(self, action: Dict[str, Any]) -> bool:
             """
@@ -405,69 +685,309 @@ class AuthenticationManager:
                 self.logger.error("Driver not initialized")
                 return False
                 
-            try:
-                action_type = action.get("type", "")
+            action_type = action.get("type", "")
+            handler = self._action_handlers.get(action_type)
+            if handler is None:
+                self.logger.warning(f"Unknown action type: {action_type}")
+                return False
                 
-                if action_type == "wait":
-                    seconds = action.get("seconds", 1)
-                    self.logger.debug(f"Waiting for {seconds} seconds")
-                    time.sleep(seconds)
-                    
-                elif action_type == "click":
-                    selector = action.get("selector", "")
-                    self.logger.debug(f"Clicking on element: {selector}")
-                    element = WebDriverWait(self.driver, 20).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    element.click()
-                    
-                elif action_type == "input":
-                    selector = action.get("selector", "")
-                    value = action.get("value", "")
-                    self.logger.debug(f"Entering text in element: {selector}")
-                    element = WebDriverWait(self.driver, 20).until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    element.clear()
-                    element.send_keys(value)
-                    
-                elif action_type == "screenshot":
-                    if self.output_manager:
-                        filename = action.get("filename", f"auth_{int(time.time())}.png")
-                        file_path = self.output_manager.get_path("screenshots", filename)
-                        self.output_manager.ensure_path_exists("screenshots")
-                        self.driver.save_screenshot(str(file_path))
-                        self.logger.debug(f"Screenshot saved to {file_path}")
-                    
-                elif action_type == "script":
-                    code = action.get("code", "")
-                    self.logger.debug("Executing JavaScript")
-                    self.driver.execute_script(code)
-                    
-                elif action_type == "cookie_banner":
-                    self.logger.debug("Handling cookie banner")
-                    cookie_script = """
-                    var cookieButtons = document.querySelectorAll('button[id*="cookie"], button[class*="cookie"], button[id*="consent"], button[class*="consent"], #onetrust-accept-btn-handler');
-                    for(var i=0; i<cookieButtons.length; i++) {
-                        if(cookieButtons[i].offsetParent !== null) {
-                            cookieButtons[i].click();
-                            return true;
-                        }
-                    }
-                    return false;
-                    """
-                    self.driver.execute_script(cookie_script)
-                    
-                else:
-                    self.logger.warning(f"Unknown action type: {action_type}")
-                    return False
-                    
+            try:
+                handler(action)
                 return True
                 
             except Exception as e:
                 self.logger.error(f"Error performing action: {e}")
                 return False
     
+    def _act_wait(self, action: Dict[str, Any]) -> None:
+            """
+            Wait for a condition, or pause for a fixed time if none is given.
+            
+            Supported keys, in order of preference: until_selector (element
+            visible), selector (element present), script (JS expression that
+            becomes truthy), seconds (plain sleep). timeout bounds the conditional
+            waits and defaults to AUTH_WAIT_TIMEOUT.
+            """
+            timeout = action.get("timeout", self.wait_timeout)
+            wait = self._wait if timeout == self.wait_timeout else self._make_wait(timeout)
+            
+            if action.get("until_selector"):
+                self.logger.debug(f"Waiting up to {timeout} seconds for {action['until_selector']} to be visible")
+                wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, action["until_selector"])))
+            elif action.get("selector"):
+                self.logger.debug(f"Waiting up to {timeout} seconds for {action['selector']}")
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, action["selector"])))
+            elif action.get("script"):
+                self.logger.debug(f"Waiting up to {timeout} seconds for script condition")
+                script = action["script"]
+                if not script.lstrip().startswith("return"):
+                    script = f"return ({script});"
+                wait.until(lambda d: d.execute_script(script))
+            else:
+                seconds = action.get("seconds", 1)
+                self.logger.debug(f"Waiting for {seconds} seconds")
+                time.sleep(seconds)
+    
+    def _act_click(self, action: Dict[str, Any]) -> None:
+            """Click on the element matching the action selector."""
+            selector = action.get("selector", "")
+            self.logger.debug(f"Clicking on element: {selector}")
+            for attempt in range(2):
+                element = self._wait.until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                )
+                try:
+                    element.click()
+                    return
+                except StaleElementReferenceException:
+                    # The page re-rendered the element: locate it once more
+                    if attempt:
+                        raise
+                    self.logger.debug(f"Stale element {selector}, retrying")
+    
+    def _act_input(self, action: Dict[str, Any]) -> None:
+            """Type the action value into the element matching the selector."""
+            selector = action.get("selector", "")
+            self.logger.debug(f"Entering text in element: {selector}")
+            self._fill(selector, action.get("value", ""))
+    
+    def _fill(self, selector: str, value: str) -> None:
+            """
+            Replace the content of a visible input field.
+            
+            The value is set through the native setter, so framework-controlled
+            inputs (React, Vue) see the change, followed by input/change events.
+            
+            Args:
+                selector: CSS selector of the field
+                value: Text to type into it
+            """
+            for attempt in range(2):
+                element = self._wait.until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
+                )
+                try:
+                    # One round-trip instead of clear() plus a key event per character
+                    self.driver.execute_script(self._SET_FIELD_JS, element, value)
+                    return
+                except StaleElementReferenceException:
+                    # The page re-rendered the element: locate it once more
+                    if attempt:
+                        raise
+                    self.logger.debug(f"Stale element {selector}, retrying")
+    
+    def _screenshot_path(self, filename: str) -> Path:
+            """Return the path of a screenshot, creating the screenshots directory once."""
+            if not self._screenshots_dir_ready:
+                self.output_manager.ensure_path_exists("screenshots")
+                self._screenshots_dir_ready = True
+            return self.output_manager.get_path("screenshots", filename)
+    
+    def _write_screenshot(self, path: Path, driver: "webdriver.Chrome") -> None:
+            """Capture a screenshot now and write it to disk on a background thread."""
+            png_bytes = driver.get_screenshot_as_png()
+            if self._screenshot_pool is None:
+                self._screenshot_pool = ThreadPoolExecutor(max_workers=1)
+            self._screenshot_pool.submit(path.write_bytes, png_bytes)
+    
+    def _save_debug_screenshot(self, filename: str, driver: "Optional[webdriver.Chrome]" = None) -> None:
+            """
+            Save a debugging screenshot of the authentication flow if AUTH_DEBUG_SCREENSHOTS is on.
+            
+            Args:
+                filename: Screenshot file name inside the screenshots directory
+                driver: Driver to capture, defaults to self.driver
+            """
+            driver = driver or self.driver
+            if not self.output_manager or not driver:
+                return
+            if not self.debug_screenshots:
+                return
+                
+            try:
+                screenshot_path = self._screenshot_path(filename)
+                self._write_screenshot(screenshot_path, driver)
+                self.logger.info(f"Authentication screenshot queued to {screenshot_path}")
+            except Exception as e:
+                self.logger.warning(f"Could not save screenshot {filename}: {e}")
+    
+    def _act_screenshot(self, action: Dict[str, Any]) -> None:
+            """Save a screenshot of the current page."""
+            if self.output_manager:
+                filename = action.get("filename", f"auth_{int(time.time())}.png")
+                file_path = self._screenshot_path(filename)
+                self._write_screenshot(file_path, self.driver)
+                self.logger.debug(f"Screenshot queued to {file_path}")
+    
+    def _act_script(self, action: Dict[str, Any]) -> None:
+            """Execute the JavaScript code of the action."""
+            code = action.get("code", "")
+            self.logger.debug("Executing JavaScript")
+            self.driver.execute_script(code)
+    
+    def _act_cookie_banner(self, action: Dict[str, Any]) -> None:
+            """Dismiss a visible cookie consent banner."""
+            # Run even when the page observer is installed: it stops after its first
+            # click, and the script is a no-op when no banner is visible
+            self.logger.debug("Handling cookie banner")
+            self.driver.execute_script(self._COOKIE_BANNER_JS)
+    
+    def _install_cookie_banner_observer(self, driver: "webdriver.Chrome") -> Optional[str]:
+            """
+            Register the cookie banner observer on every new document of a driver.
+            
+            Opt-in through AUTH_COOKIE_BANNER_OBSERVER and only meant for the login
+            flow: the observer clicks consent buttons, which must not happen on the
+            pages audited later with the same browser.
+            
+            Args:
+                driver: Selenium webdriver to configure
+                
+            Returns:
+                Identifier to pass to _remove_cookie_banner_observer, or None if not installed
+            """
+            if not self.config_manager.get_bool("AUTH_COOKIE_BANNER_OBSERVER", False):
+                return None
+                
+            try:
+                result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": self._COOKIE_BANNER_OBSERVER_JS})
+                return result.get("identifier")
+            except Exception as e:
+                self.logger.warning(f"Could not install cookie banner observer: {e}")
+                return None
+    
+    def _remove_cookie_banner_observer(self, driver: "webdriver.Chrome", identifier: Optional[str]) -> None:
+            """Unregister the cookie banner observer installed by _install_cookie_banner_observer."""
+            if not identifier:
+                return
+            try:
+                driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+            except Exception as e:
+                self.logger.warning(f"Could not remove cookie banner observer: {e}")
+    
+    def _execute_actions(self, actions: List[Dict[str, Any]]) -> None:
+            """
+            Execute a sequence of actions, batching consecutive DOM actions.
+            
+            Consecutive click/input/script actions are sent to the browser in a
+            single execute_script call; a click closes the batch, since it may
+            navigate away, and any other action type acts as a barrier and is
+            executed on its own through perform_action.
+            
+            Args:
+                actions: List of action dictionaries
+            """
+            batch = []
+            for action in actions or []:
+                action_type = action.get("type", "")
+                if action_type in self._BATCHABLE_ACTIONS:
+                    batch.append(action)
+                    if action_type == "click":
+                        self._flush_action_batch(batch)
+                        batch = []
+                    continue
+                self._flush_action_batch(batch)
+                batch = []
+                self.perform_action(action)
+            self._flush_action_batch(batch)
+    
+    def _flush_action_batch(self, batch: List[Dict[str, Any]]) -> None:
+            """
+            Run a batch of DOM actions in one round trip.
+            
+            If a step's element is missing, hidden or disabled, that step and the
+            following ones fall back to perform_action, which waits for each
+            element. A step that fails after starting is logged and not repeated:
+            the fallback resumes after it.
+            
+            Args:
+                batch: List of click/input/script actions
+            """
+            if not batch:
+                return
+                
+            if len(batch) == 1:
+                self.perform_action(batch[0])
+                return
+                
+            steps = [
+                {
+                    "type": action.get("type", ""),
+                    "selector": action.get("selector", ""),
+                    "value": action.get("value", ""),
+                    "code": action.get("code", "")
+                }
+                for action in batch
+            ]
+            
+            try:
+                self.logger.debug(f"Executing {len(steps)} actions in a single script")
+                result = self.driver.execute_script(self._BATCH_ACTIONS_SCRIPT, steps)
+            except Exception as e:
+                # Resume after the last step that started, so no side effect runs twice
+                try:
+                    started = self.driver.execute_script("return window.__axeBatchStep;")
+                except Exception:
+                    started = None
+                self.logger.warning(f"Batched actions failed, executing the remaining ones one by one: {e}")
+                result = [started, True] if isinstance(started, int) and started >= 0 else [0, False]
+                
+            if not result:
+                return
+            failed_index, started = result
+            if started:
+                self.logger.error(f"Batched action {failed_index} ({steps[failed_index]['type']}) failed, skipping it")
+                failed_index += 1
+            for action in batch[failed_index:]:
+                self.perform_action(action)
+    
+    def _wait_for_page_ready(self, timeout: Optional[int] = None, driver: "Optional[webdriver.Chrome]" = None) -> bool:
+            """
+            Wait until the current document has finished loading.
+            
+            Args:
+                timeout: Maximum seconds to wait, defaults to AUTH_WAIT_TIMEOUT
+                driver: Driver to wait on, defaults to self.driver
+                
+            Returns:
+                True if the page reported readyState "complete" in time
+            """
+            try:
+                self._make_wait(timeout, driver).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+                return True
+            except TimeoutException:
+                self.logger.warning(f"Page not ready after {timeout or self.wait_timeout} seconds")
+                return False
+    
+    def _wait_for_login_complete(self, timeout: Optional[int] = None) -> bool:
+            """
+            Wait for the page reached after submitting the login form.
+            
+            Returns as soon as the success indicator is visible, or as soon as the
+            document is loaded when no indicator is configured.
+            
+            Args:
+                timeout: Maximum seconds to wait, defaults to AUTH_WAIT_TIMEOUT
+                
+            Returns:
+                True if the success indicator became visible (or the page loaded,
+                when no indicator is configured) within the timeout
+            """
+            success_indicator = self.auth_config.get("success_indicator")
+            if not success_indicator:
+                return self._wait_for_page_ready(timeout)
+                
+            try:
+                self._make_wait(timeout).until(
+                    EC.visibility_of_element_located((By.CSS_SELECTOR, success_indicator))
+                )
+                return True
+            except TimeoutException:
+                self.logger.debug("Success indicator not visible after login submit")
+                return False
+    
     def perform_http_basic_auth(self) -> bool:
             """
             Perform HTTP Basic Authentication.
@@ -475,10 +995,11 @@ class AuthenticationManager:
             Returns:
                 True if authentication was successful
             """
-            if not self.auth_config.get("strategies", []):
+            strategies = self.auth_config.get("strategies", [])
+            if not strategies:
                 return False
 
-            if "http_basic" not in self.auth_config.get("strategies", []):
+            if "http_basic" not in strategies:
                 self.logger.info("HTTP Basic Authentication not enabled")
                 return True  # Not an error, just skipping
                 
@@ -497,21 +1018,14 @@ class AuthenticationManager:
             
             try:
                 # Format base URL with HTTP Basic Auth credentials
-                base_url = self.auth_config.get("base_url", "")
-                if not base_url:
-                    # Try to extract base URL from login URL
-                    login_url = self.auth_config.get("login_url", "")
-                    if login_url:
-                        from urllib.parse import urlparse
-                        parsed = urlparse(login_url)
-                        base_url = f"{parsed.scheme}://{parsed.netloc}"
+                # Fall back to the origin of the login URL
+                base_url = self.auth_config.get("base_url", "") or self._base_url
                 
                 if not base_url:
                     self.logger.error("No base URL available for HTTP Basic Auth")
                     return False
                     
                 # Construct URL with credentials
-                from urllib.parse import urlparse, urlunparse
                 parsed_url = urlparse(base_url)
                 auth_url = urlunparse((
                     parsed_url.scheme,
@@ -526,25 +1040,87 @@ class AuthenticationManager:
                 self.driver.get(auth_url)
                 
                 # Wait for the page to load
-                time.sleep(5)
+                self._wait_for_page_ready()
+                
+                # Check if authentication was successful (no auth dialog): read the
+                # document's HTTP status, falling back to the page text on old browsers
+                status = self.driver.execute_script(self._NAVIGATION_STATUS_JS)
+                if status:
+                    failed = status == 401
+                else:
+                    page_text = self.driver.execute_script("return document.documentElement.innerText") or ""
+                    failed = "401 Unauthorized" in page_text or "Authentication Required" in page_text
+                if failed:
+                    self.logger.error("HTTP Basic Authentication failed - 401 response detected")
+                    return False
+                    
+                self.logger.info("HTTP Basic Authentication successful")
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"Error during HTTP Basic Authentication: {e}")
+                return False
+    
+    def try_restore_session(self) -> bool:
+            """
+            Restore the session from the cookie checkpoint and check it is still live.
+            
+            HTTP Basic Authentication, when enabled, is performed as usual; the form
+            cookies are then injected into the driver and the first restricted URL is
+            visited: the session is rejected if the browser lands on the login page or
+            the success indicator (when configured) does not show up.
+            
+            Returns:
+                True if the restored session can be used
+            """
+            if not self._load_cookie_checkpoint():
+                return False
+                
+            try:
+                # The browser is needed anyway by the callers of the authenticated driver
+                self.initialize_driver(headless=self.config_manager.get_bool("AXE_HEADLESS", True))
+                
+                # Only the form cookies come from the checkpoint: HTTP Basic is applied as usual
+                if "http_basic" in self.auth_config.get("strategies", []) and not self.perform_http_basic_auth():
+                    raise RuntimeError("HTTP Basic Authentication failed")
+                    
+                if not self._apply_cookies_to_driver(self.driver):
+                    raise RuntimeError("cookies could not be applied")
+                self.is_authenticated = True
+                
+                if not self._restricted_prefixes:
+                    # Nothing to verify against, trust the checkpoint TTL
+                    return True
+                    
+                verify_url = self._restricted_prefixes[0]
+                self.driver.get(verify_url)
+                self._wait_for_page_ready()
                 
-                # Check if authentication was successful (no auth dialog)
-                # This is hard to detect directly, so we'll check for signs of successful loading
-                if "401 Unauthorized" in self.driver.page_source or "Authentication Required" in self.driver.page_source:
-                    self.logger.error("HTTP Basic Authentication failed - 401 response detected")
-                    return False
+                login_url = self.auth_config.get("login_url")
+                if login_url and self.driver.current_url.startswith(login_url):
+                    raise RuntimeError("redirected to the login page")
                     
-                self.logger.info("HTTP Basic Authentication successful")
+                if self.auth_config.get("success_indicator"):
+                    self._make_wait(5).until(
+                        EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["success_indicator"]))
+                    )
+                    
+                self.logger.info(f"Restored session verified on {verify_url}")
                 return True
                 
             except Exception as e:
-                self.logger.error(f"Error during HTTP Basic Authentication: {e}")
+                self.logger.info(f"Restored session rejected, logging in again: {e or type(e).__name__}")
+                self.is_authenticated = False
+                self.cookies = None
                 return False
     
-    def login(self) -> bool:
+    def login(self, force_refresh: bool = False) -> bool:
             """
             Perform all configured authentication steps in sequence.
             
+            Args:
+                force_refresh: Ignore the cookie checkpoint and log in again
+            
             Returns:
                 True if authentication was successful
             """
@@ -552,12 +1128,27 @@ class AuthenticationManager:
                 self.logger.info("Authentication is disabled")
                 return False
                 
-            if self.is_authenticated:
+            if self.is_authenticated and not force_refresh:
                 self.logger.info("Already authenticated")
                 return True
                 
+            strategies = self.auth_config.get("strategies", [])
+            uses_form = "form" in strategies or "http_form" in strategies
+                
+            # Reuse cookies from a recent run instead of driving the login again
+            if not force_refresh and uses_form and self.try_restore_session():
+                self.logger.info("Authentication restored from cookie checkpoint")
+                return True
+                
+            self.is_authenticated = False
             self.logger.info("Starting authentication sequence")
             
+            # 0. Try a plain HTTP form login first: no browser needed if it works
+            if "http_form" in strategies and self._perform_http_form_auth():
+                self.is_authenticated = True
+                self._save_cookie_checkpoint()
+                return True
+            
             # Initialize driver if not already
             self.initialize_driver(headless=self.config_manager.get_bool("AXE_HEADLESS", True))
             
@@ -567,9 +1158,12 @@ class AuthenticationManager:
                 self.logger.error("HTTP Basic Authentication failed, aborting authentication sequence")
                 return False
             
-            # 2. Proceed with form authentication if enabled
-            if "form" in self.auth_config.get("strategies", []) and self.auth_config.get("login_url"):
-                return self._perform_form_auth()
+            # 2. Proceed with form authentication if enabled (also the fallback for http_form)
+            if uses_form and self.auth_config.get("login_url"):
+                form_auth_success = self._perform_form_auth()
+                if form_auth_success:
+                    self._save_cookie_checkpoint()
+                return form_auth_success
             elif basic_auth_success:
                 # If only HTTP Basic Auth was needed and it succeeded
                 self.is_authenticated = True
@@ -577,239 +1171,255 @@ class AuthenticationManager:
             
             return False
     
-    def _perform_form_auth(self) -> bool:
+    def _perform_http_form_auth(self) -> bool:
             """
-            Perform form-based authentication.
+            Perform form authentication with a plain HTTP POST, without a browser.
+            
+            Only works for login forms that do not need JavaScript; when it fails
+            the caller falls back to the Selenium form login. The login counts as
+            successful only if the POST sets new or changed cookies, does not land
+            back on the login path, and the configured success/error indicators
+            (CSS selectors, checked with BeautifulSoup) match the response page.
             
             Returns:
-                True if authentication was successful
+                True if the login succeeded and session cookies were collected
             """
-            if not self.auth_config.get("login_url"):
-                self.logger.error("Login URL not specified for form authentication")
-                return False
-                
-            self.logger.info(f"Performing form authentication to {self.auth_config['login_url']}")
-            
             try:
-                # Navigate to login page
-                self.driver.get(self.auth_config["login_url"])
-                
-                # Take screenshot of login page
-                if self.output_manager:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_login_page.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
-                
-                # Perform pre-login actions
-                for action in self.auth_config["pre_login_actions"]:
-                    self.perform_action(action)
-                
-                # Fill username
-                if self.auth_config.get("username_selector"):
-                    username_field = WebDriverWait(self.driver, 20).until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["username_selector"]))
-                    )
-                    username_field.clear()
-                    username_field.send_keys(self.auth_config.get("username", ""))
+                import httpx
+            except ImportError:
+                self.logger.info("httpx not installed, skipping HTTP form authentication")
+                return False
                 
-                # Fill password
-                if self.auth_config.get("password_selector"):
-                    password_field = WebDriverWait(self.driver, 20).until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["password_selector"]))
-                    )
-                    password_field.clear()
-                    password_field.send_keys(self.auth_config.get("password", ""))
+            login_url = self.auth_config.get("login_url", "")
+            if not login_url:
+                return False
                 
-                # Submit form
-                if self.auth_config.get("submit_selector"):
-                    submit_button = WebDriverWait(self.driver, 20).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, self.auth_config["submit_selector"]))
-                    )
-                    submit_button.click()
+            self.logger.info(f"Performing HTTP form authentication to {login_url}")
+            
+            basic_auth = None
+            if self.auth_config.get("http_basic_username") and self.auth_config.get("http_basic_password"):
+                basic_auth = (self.auth_config["http_basic_username"], self.auth_config["http_basic_password"])
                 
-                # Wait for login to complete
-                time.sleep(5)
+            try:
+                with httpx.Client(follow_redirects=True, auth=basic_auth, timeout=30) as client:
+                    # Load the login page to get session cookies and hidden fields (CSRF tokens)
+                    login_page = client.get(login_url)
+                    # Cookies the anonymous visit already set: the login must add or change one
+                    cookies_before = {
+                        (cookie.name, cookie.domain, cookie.path): cookie.value for cookie in client.cookies.jar
+                    }
+                    hidden_inputs = _HiddenInputParser()
+                    hidden_inputs.feed(login_page.text)
+                    
+                    form_data = dict(hidden_inputs.fields)
+                    form_data[self.auth_config["http_username_field"]] = self.auth_config.get("username", "")
+                    form_data[self.auth_config["http_password_field"]] = self.auth_config.get("password", "")
+                    
+                    response = client.post(login_url, data=form_data)
+                    
+                    cookies = []
+                    session_cookie_set = False
+                    for cookie in client.cookies.jar:
+                        if cookies_before.get((cookie.name, cookie.domain, cookie.path)) != cookie.value:
+                            session_cookie_set = True
+                        cookie_dict = {
+                            "name": cookie.name,
+                            "value": cookie.value,
+                            "domain": cookie.domain,
+                            "path": cookie.path or "/",
+                            "secure": bool(cookie.secure)
+                        }
+                        if cookie.expires:
+                            cookie_dict["expiry"] = int(cookie.expires)
+                        cookies.append(cookie_dict)
+            except httpx.HTTPError as e:
+                self.logger.warning(f"HTTP form authentication error: {e}")
+                return False
                 
-                # Perform post-login actions
-                for action in self.auth_config.get("post_login_actions", []):
-                    self.perform_action(action)
+            if response.status_code >= 400:
+                self.logger.warning(f"HTTP form authentication failed - status {response.status_code}")
+                return False
                 
-                # Check for success indicator
-                if self.auth_config.get("success_indicator"):
-                    try:
-                        WebDriverWait(self.driver, 20).until(
-                            EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["success_indicator"]))
-                        )
-                        self.logger.info("Form authentication successful - success indicator found")
-                        self.is_authenticated = True
-                    except TimeoutException:
-                        self.logger.error("Form authentication failed - success indicator not found")
-                        return False
+            # Staying on the login page (e.g. /login?error=1) usually means rejected
+            # credentials or a JS-driven form
+            if response.url.path.rstrip("/") == urlparse(login_url).path.rstrip("/"):
+                self.logger.info("HTTP form authentication did not leave the login page, falling back to Selenium")
+                return False
                 
-                # Check for error indicator
-                if self.auth_config.get("error_indicator"):
-                    try:
-                        error_element = self.driver.find_element(By.CSS_SELECTOR, self.auth_config["error_indicator"])
-                        if error_element.is_displayed():
-                            self.logger.error(f"Form authentication failed - error detected: {error_element.text}")
-                            return False
-                    except:
-                        # No error found, which is good
-                        pass
+            if not session_cookie_set:
+                self.logger.info("HTTP form authentication set no new session cookies, falling back to Selenium")
+                return False
                 
-                # If no explicit success/error indicators, assume success if neither is set
-                if not self.auth_config.get("success_indicator") and not self.auth_config.get("error_indicator"):
-                    self.logger.info("Form authentication assumed successful (no indicators set)")
-                    self.is_authenticated = True
+            if not self._http_login_page_ok(response.text):
+                return False
                 
-                # Store cookies for later use
-                self.cookies = self.driver.get_cookies()
+            self.cookies = cookies
+            self.logger.info(f"HTTP form authentication successful ({len(cookies)} cookies)")
+            return True
+    
+    def _http_login_page_ok(self, html: str) -> bool:
+            """
+            Check the page returned by an HTTP form login against the configured indicators.
+            
+            Args:
+                html: Body of the response to the login POST
                 
-                # Take a screenshot of successful login
-                if self.output_manager:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_success.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
-                    self.logger.info(f"Authentication screenshot saved to {screenshot_path}")
+            Returns:
+                True if the success indicator (when set) is present and the error
+                indicator (when set) is absent
+            """
+            success_indicator = self.auth_config.get("success_indicator")
+            error_indicator = self.auth_config.get("error_indicator")
+            if not success_indicator and not error_indicator:
+                return True
                 
-                self.logger.info("Form authentication completed successfully")
-                return self.is_authenticated
+            try:
+                from bs4 import BeautifulSoup
+            except ImportError:
+                self.logger.info("beautifulsoup4 not installed, cannot check login indicators, falling back to Selenium")
+                return False
                 
+            try:
+                page = BeautifulSoup(html, "html.parser")
+                if success_indicator and page.select_one(success_indicator) is None:
+                    self.logger.info("HTTP form authentication: success indicator not found, falling back to Selenium")
+                    return False
+                if error_indicator and page.select_one(error_indicator) is not None:
+                    self.logger.info("HTTP form authentication: error indicator found, falling back to Selenium")
+                    return False
             except Exception as e:
-                self.logger.error(f"Form authentication error: {e}")
-                
-                # Take screenshot of error state
-                if self.output_manager and self.driver:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_error.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
-                    self.logger.info(f"Authentication error screenshot saved to {screenshot_path}")
-                    
+                self.logger.info(f"Could not check login indicators ({e}), falling back to Selenium")
                 return False
+                
+            return True
     
-    def _form_login(self) -> bool:
+    def _perform_form_auth(self) -> bool:
             """
             Perform form-based authentication.
             
             Returns:
                 True if authentication was successful
             """
-            if not self.auth_config["login_url"]:
-                self.logger.error("Login URL not specified")
+            # Read the form settings once instead of indexing auth_config at every step
+            config = self.auth_config
+            login_url = config.get("login_url")
+            success_indicator = config.get("success_indicator")
+            error_indicator = config.get("error_indicator")
+            
+            if not login_url:
+                self.logger.error("Login URL not specified for form authentication")
                 return False
                 
-            if self.is_authenticated:
-                self.logger.info("Already authenticated")
-                return True
-                
-            self.logger.info(f"Performing form authentication to {self.auth_config['login_url']}")
+            self.logger.info(f"Performing form authentication to {login_url}")
             
+            # Cookie banners are dismissed automatically only during the login itself
+            observer_id = self._install_cookie_banner_observer(self.driver)
             try:
-                # Initialize driver if not already
-                self.initialize_driver(headless=self.config_manager.get_bool("AXE_HEADLESS", True))
-                
                 # Navigate to login page
-                self.driver.get(self.auth_config["login_url"])
+                self.driver.get(login_url)
                 
                 # Take screenshot of login page
-                if self.output_manager:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_login_page.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
+                self._save_debug_screenshot("auth_login_page.png")
                 
                 # Perform pre-login actions
-                for action in self.auth_config["pre_login_actions"]:
-                    self.perform_action(action)
+                self._execute_actions(config["pre_login_actions"])
                 
                 # Fill username
-                if self.auth_config["username_selector"]:
-                    username_field = WebDriverWait(self.driver, 20).until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["username_selector"]))
-                    )
-                    username_field.clear()
-                    username_field.send_keys(self.auth_config["username"])
+                if config.get("username_selector"):
+                    self._fill(config["username_selector"], config.get("username", ""))
                 
                 # Fill password
-                if self.auth_config["password_selector"]:
-                    password_field = WebDriverWait(self.driver, 20).until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["password_selector"]))
-                    )
-                    password_field.clear()
-                    password_field.send_keys(self.auth_config["password"])
+                if config.get("password_selector"):
+                    self._fill(config["password_selector"], config.get("password", ""))
                 
                 # Submit form
-                if self.auth_config["submit_selector"]:
-                    submit_button = WebDriverWait(self.driver, 20).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, self.auth_config["submit_selector"]))
+                if config.get("submit_selector"):
+                    submit_button = self._wait.until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, config["submit_selector"]))
                     )
                     submit_button.click()
                 
-                # Wait for login to complete
-                time.sleep(5)
+                # Wait for login to complete (up to AUTH_WAIT_TIMEOUT for the success indicator)
+                login_complete = self._wait_for_login_complete()
                 
                 # Perform post-login actions
-                for action in self.auth_config["post_login_actions"]:
-                    self.perform_action(action)
-                
-                # Check for success indicator
-                if self.auth_config["success_indicator"]:
-                    try:
-                        WebDriverWait(self.driver, 20).until(
-                            EC.visibility_of_element_located((By.CSS_SELECTOR, self.auth_config["success_indicator"]))
-                        )
-                        self.logger.info("Authentication successful - success indicator found")
-                        self.is_authenticated = True
-                    except TimeoutException:
-                        self.logger.error("Authentication failed - success indicator not found")
+                post_login_actions = config.get("post_login_actions", [])
+                self._execute_actions(post_login_actions)
+                
+                # Check for success indicator: already waited for above, so only a
+                # short re-check when post-login actions may have revealed it
+                if success_indicator:
+                    if not login_complete and post_login_actions:
+                        login_complete = self._wait_for_login_complete(timeout=1)
+                    if not login_complete:
+                        self.logger.error("Form authentication failed - success indicator not found")
                         return False
+                    self.logger.info("Form authentication successful - success indicator found")
+                    self.is_authenticated = True
                 
                 # Check for error indicator
-                if self.auth_config["error_indicator"]:
+                if error_indicator:
                     try:
-                        error_element = self.driver.find_element(By.CSS_SELECTOR, self.auth_config["error_indicator"])
-                        if error_element.is_displayed():
-                            self.logger.error(f"Authentication failed - error detected: {error_element.text}")
-                            return False
-                    except:
+                        error_element = self._make_wait(1).until(
+                            EC.visibility_of_element_located((By.CSS_SELECTOR, error_indicator))
+                        )
+                        self.logger.error(f"Form authentication failed - error detected: {error_element.text}")
+                        return False
+                    except TimeoutException:
                         # No error found, which is good
                         pass
                 
                 # If no explicit success/error indicators, assume success if neither is set
-                if not self.auth_config["success_indicator"] and not self.auth_config["error_indicator"]:
-                    self.logger.info("Authentication assumed successful (no indicators set)")
+                if not success_indicator and not error_indicator:
+                    self.logger.info("Form authentication assumed successful (no indicators set)")
                     self.is_authenticated = True
                 
                 # Store cookies for later use
                 self.cookies = self.driver.get_cookies()
                 
                 # Take a screenshot of successful login
-                if self.output_manager:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_success.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
-                    self.logger.info(f"Authentication screenshot saved to {screenshot_path}")
+                self._save_debug_screenshot("auth_success.png")
                 
-                self.logger.info("Authentication completed successfully")
+                self.logger.info("Form authentication completed successfully")
                 return self.is_authenticated
                 
             except Exception as e:
-                self.logger.error(f"Authentication error: {e}")
+                self.logger.error(f"Form authentication error: {e}")
                 
                 # Take screenshot of error state
-                if self.output_manager and self.driver:
-                    screenshot_path = self.output_manager.get_path("screenshots", "auth_error.png")
-                    self.output_manager.ensure_path_exists("screenshots")
-                    self.driver.save_screenshot(str(screenshot_path))
-                    self.logger.info(f"Authentication error screenshot saved to {screenshot_path}")
+                self._save_debug_screenshot("auth_error.png")
                     
                 return False
+            finally:
+                self._remove_cookie_banner_observer(self.driver, observer_id)
+    
+    def _form_login(self) -> bool:
+            """
+            Perform form-based authentication, starting the driver if needed.
+            
+            Kept for older callers; the login itself is _perform_form_auth.
+            
+            Returns:
+                True if authentication was successful
+            """
+            if self.is_authenticated:
+                self.logger.info("Already authenticated")
+                return True
+                
+            self.initialize_driver(headless=self.config_manager.get_bool("AXE_HEADLESS", True))
+            return self._perform_form_auth()
     
-    def apply_auth_to_driver(self, driver: webdriver.Chrome) -> bool:
+    def apply_auth_to_driver(self, driver: "webdriver.Chrome", reload_after_auth: bool = False) -> bool:
             """
             Apply authentication to another Selenium driver.
             
+            Cookies and headers are injected without navigating, so they take effect
+            from the next page load on.
+            
             Args:
                 driver: Selenium webdriver to apply authentication to
+                reload_after_auth: Reload the current page so the authentication
+                    applies to it immediately
                 
             Returns:
                 True if authentication was applied successfully
@@ -817,77 +1427,82 @@ class AuthenticationManager:
             # Determine what kind of authentication to apply
             strategies = self.auth_config.get("strategies", ["form"])
             
-            if "http_basic" in strategies and self.http_basic_credentials:
+            if "http_basic" in strategies and self._basic_auth_headers:
                 # For HTTP Basic, we need to add authentication script to the page
                 self.logger.info("Applying HTTP Basic authentication to driver")
                 try:
-                    # Execute CDP command to set HTTP Basic auth
-                    username = self.auth_config.get("http_basic_username", "")
-                    password = self.auth_config.get("http_basic_password", "")
-                    
-                    if username and password:
-                        # Add authentication header via CDP
-                        network_conditions = {
-                            'offline': False,
-                            'latency': 0,
-                            'downloadThroughput': 0,
-                            'uploadThroughput': 0
-                        }
-                        driver.execute_cdp_cmd('Network.emulateNetworkConditions', network_conditions)
+                    # Add the precomputed authentication header via CDP; the Network
+                    # domain only needs enabling once per browser, flagged on the driver
+                    # itself so pooled drivers keep it across managers
+                    if not getattr(driver, "_auth_network_enabled", False):
                         driver.execute_cdp_cmd('Network.enable', {})
-                        driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
-                            'headers': {'Authorization': self.http_basic_credentials}
-                        })
-                        
-                        self.logger.info("HTTP Basic authentication applied to driver")
-                        return True
+                        driver._auth_network_enabled = True
+                    driver.execute_cdp_cmd('Network.setExtraHTTPHeaders', {
+                        'headers': self._basic_auth_headers
+                    })
+                    if reload_after_auth:
+                        driver.refresh()
+                    
+                    self.logger.info("HTTP Basic authentication applied to driver")
+                    return True
                 except Exception as e:
                     self.logger.error(f"Error applying HTTP Basic authentication: {e}")
                     return False
                     
             # For form authentication, apply cookies
-            if "form" in strategies and self.is_authenticated and self.cookies:
-                self.logger.info("Applying form authentication cookies to driver")
-                try:
-                    # Get current URL to return to it after setting cookies
-                    current_url = driver.current_url
-                    
-                    # Extract domain from login URL to set cookies
-                    main_domain = self.auth_config["login_url"].split("//")[1].split("/")[0]
-                    
-                    # Need to visit the domain before setting cookies
-                    driver.get(f"https://{main_domain}")
-                    
-                    # Add each cookie to the driver
-                    for cookie in self.cookies:
-                        try:
-                            # Remove problematic cookie attributes that might cause issues
-                            if 'expiry' in cookie:
-                                # Convert to int as required by Selenium
-                                cookie['expiry'] = int(cookie['expiry'])
-                            
-                            # Remove attributes not supported by Selenium
-                            for attr in ['sameSite', 'priority', 'storeId', 'hostOnly']:
-                                if attr in cookie:
-                                    del cookie[attr]
-                            
-                            driver.add_cookie(cookie)
-                        except Exception as e:
-                            self.logger.warning(f"Error adding cookie: {e}")
-                    
-                    # Return to original URL
-                    driver.get(current_url)
-                    
-                    self.logger.info(f"Authentication cookies applied to driver")
-                    return True
-                    
-                except Exception as e:
-                    self.logger.error(f"Error applying authentication to driver: {e}")
-                    return False
+            if ("form" in strategies or "http_form" in strategies) and self.is_authenticated and self.cookies:
+                return self._apply_cookies_to_driver(driver, reload_after_auth)
                     
             self.logger.warning("No authentication method available to apply to driver")
             return False
     
+    def _apply_cookies_to_driver(self, driver: "webdriver.Chrome", reload_after_auth: bool = False) -> bool:
+            """
+            Inject the form authentication cookies into a Selenium driver.
+            
+            Args:
+                driver: Selenium webdriver to apply the cookies to
+                reload_after_auth: Reload the current page so the cookies apply to it immediately
+                
+            Returns:
+                True if the cookies were applied
+            """
+            self.logger.info("Applying form authentication cookies to driver")
+            try:
+                # Chrome accepts the whole cookie jar in one CDP call, without navigating
+                try:
+                    cdp_cookies = [self._cdp_cookie(cookie, self._base_url) for cookie in self.cookies]
+                    driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+                    if reload_after_auth:
+                        driver.refresh()
+                    self.logger.info("Authentication cookies applied to driver via CDP")
+                    return True
+                except Exception as e:
+                    self.logger.debug(f"CDP cookie injection unavailable, using add_cookie: {e}")
+                
+                # Get current URL to return to it after setting cookies
+                current_url = driver.current_url
+                
+                # Need to visit the domain before setting cookies
+                driver.get(self._base_url)
+                
+                # Add each cookie to the driver
+                for cookie in self.cookies:
+                    try:
+                        driver.add_cookie(self._clean_cookie(cookie))
+                    except Exception as e:
+                        self.logger.warning(f"Error adding cookie: {e}")
+                
+                # Return to original URL
+                driver.get(current_url)
+                
+                self.logger.info(f"Authentication cookies applied to driver")
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"Error applying authentication to driver: {e}")
+                return False
+    
     def apply_auth_to_request(self, url: str, headers: Dict[str, str] = None) -> Dict[str, str]:
             """
             Apply authentication to HTTP request headers.
@@ -902,12 +1517,10 @@ class AuthenticationManager:
             if headers is None:
                 headers = {}
                 
-            # Check if authentication is required for this URL
-            if not self.is_auth_required(url):
+            # Whether this URL needs auth and with which strategy, in one cached lookup
+            required, strategy = self._classify(url)
+            if not required:
                 return headers
-                
-            # Determine which auth strategy to use
-            strategy = self.get_auth_strategy_for_url(url)
             
             if strategy == "http_basic" and self.http_basic_credentials:
                 # Apply HTTP Basic auth header
@@ -916,6 +1529,148 @@ class AuthenticationManager:
             
             return headers
     
+    def _collect_from_url(self, base_url: str, driver: "webdriver.Chrome", prefixes: tuple) -> Set[str]:
+            """
+            Collect the restricted-area links found on a single page.
+            
+            Args:
+                base_url: Page to visit
+                driver: Authenticated driver used for the visit
+                prefixes: Tuple of URL prefixes that delimit the restricted area
+                
+            Returns:
+                Set of links inside the restricted area
+            """
+            driver.get(base_url)
+            
+            # Wait for the DOM and its first link instead of a fixed delay
+            try:
+                self._make_wait(10, driver).until(
+                    lambda d: d.execute_script("return document.readyState") in ("interactive", "complete")
+                )
+                self._make_wait(5, driver).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "a[href]"))
+                )
+            except TimeoutException:
+                self.logger.debug(f"No links rendered on {base_url} before timeout")
+            else:
+                # Let client-side rendering settle: stop as soon as the link count
+                # is the same on two consecutive polls
+                counts = []
+                
+                def links_settled(d) -> bool:
+                    counts.append(d.execute_script("return document.querySelectorAll('a[href]').length"))
+                    return len(counts) > 1 and counts[-1] == counts[-2]
+                    
+                try:
+                    self._make_wait(2, driver).until(links_settled)
+                except TimeoutException:
+                    self.logger.debug(f"Links on {base_url} still changing, collecting them anyway")
+            
+            # Read every href in a single round-trip instead of one per element
+            hrefs = driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href]'), a => a.href)"
+            ) or []
+            return {href for href in hrefs if href and href.startswith(prefixes)}
+    
+    def _authenticate_driver(self, driver: "webdriver.Chrome") -> bool:
+            """
+            Apply the whole current session to another driver.
+            
+            Unlike apply_auth_to_driver, which stops after the HTTP Basic header,
+            both the header and the form session cookies are applied when configured.
+            
+            Args:
+                driver: Selenium webdriver to authenticate
+                
+            Returns:
+                True if every configured authentication was applied
+            """
+            strategies = self.auth_config.get("strategies", [])
+            applied = False
+            
+            if "http_basic" in strategies and self._basic_auth_headers:
+                if not self.apply_auth_to_driver(driver):
+                    return False
+                applied = True
+                
+            if "form" in strategies or "http_form" in strategies:
+                if not self.cookies or not self._apply_cookies_to_driver(driver):
+                    return False
+                applied = True
+                
+            return applied
+    
+    def _explore_restricted_parallel(self, restricted_urls: List[str], workers: int) -> Set[str]:
+            """
+            Explore restricted URLs with a pool of authenticated drivers.
+            
+            Each worker thread takes its own Chrome driver from the shared driver pool
+            (creating one if none is idle), applies the current authentication to it
+            once and reuses it for every URL it picks up. The drivers go back to the
+            pool afterwards. If a driver cannot be authenticated the remaining URLs
+            are skipped rather than explored logged out.
+            
+            Opt-in through AUTH_EXPLORE_WORKERS > 1: by default the logged-in
+            self.driver explores the area sequentially.
+            
+            Args:
+                restricted_urls: Restricted URLs to visit
+                workers: Number of parallel drivers
+                
+            Returns:
+                Set of links inside the restricted area
+            """
+            headless = self.config_manager.get_bool("AXE_HEADLESS", True)
+            options = self._build_driver_options(headless)
+            pool_key = (headless, tuple(options.arguments))
+            prefixes = tuple(restricted_urls)
+            local = threading.local()
+            drivers = []
+            drivers_lock = threading.Lock()
+            
+            auth_failed = threading.Event()
+            
+            def explore(base_url: str) -> Set[str]:
+                if auth_failed.is_set():
+                    # Exploring logged out would only collect the login page
+                    return set()
+                driver = getattr(local, "driver", None)
+                if driver is None:
+                    driver = self._acquire_driver(pool_key)
+                    if driver is None:
+                        driver = webdriver.Chrome(options=self._build_driver_options(headless), keep_alive=True)
+                    with drivers_lock:
+                        drivers.append(driver)
+                    driver.set_page_load_timeout(15)
+                    if not self._authenticate_driver(driver):
+                        auth_failed.set()
+                        raise RuntimeError("exploration driver could not be authenticated")
+                    local.driver = driver
+                return self._collect_from_url(base_url, driver, prefixes)
+            
+            self.logger.info(f"Exploring {len(restricted_urls)} restricted URLs with {workers} drivers")
+            seen = set()
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {executor.submit(explore, url): url for url in restricted_urls}
+                    for future in as_completed(futures):
+                        try:
+                            seen.update(future.result())
+                        except Exception as e:
+                            self.logger.warning(f"Error exploring {futures[future]}: {e}")
+            finally:
+                for driver in drivers:
+                    try:
+                        self._release_driver(pool_key, driver, origins=(self._base_url,))
+                    except Exception as e:
+                        self.logger.warning(f"Exploration driver not reusable, closing it: {e}")
+                        try:
+                            driver.quit()
+                        except Exception:
+                            pass
+            return seen
+    
     def collect_authenticated_urls(self, require_auth=True) -> List[str]:
             """
             Collect URLs of authenticated sections for analysis.
@@ -932,13 +1687,14 @@ class AuthenticationManager:
                 
             try:
                 self.authenticated_urls = []
-                domain_slug = self.config_manager.domain_to_slug(self.domain) if self.domain else None
+                domain_slug = self.domain_slug
                 self.logger.info(f"Collecting restricted URLs for domain slug: {domain_slug}")
                 
-                if domain_slug and domain_slug in self.auth_config["domains"]:
+                domain_config = self.domain_auth_config
+                if domain_config:
                     # Get restricted URLs for this domain
-                    restricted_urls = self.auth_config["domains"][domain_slug].get("restricted_urls", [])
-                    explore_restricted = self.auth_config["domains"][domain_slug].get("explore_restricted_area", False)
+                    restricted_urls = domain_config.get("restricted_urls", [])
+                    explore_restricted = domain_config.get("explore_restricted_area", False)
                     
                     # If not authenticated or exploration disabled, just return the static list 
                     if not self.is_authenticated or not explore_restricted:
@@ -947,33 +1703,37 @@ class AuthenticationManager:
                     else:
                         # Visit each restricted URL and collect links within the same area
                         self.logger.info(f"Exploring restricted area to collect authenticated URLs")
-                        for base_url in restricted_urls:
-                            try:
-                                self.driver.get(base_url)
-                                time.sleep(3)  # Wait for page to load
+                        
+                        # The logged-in driver is reused unless parallel exploration is enabled
+                        workers = max(1, min(self.config_manager.get_int("AUTH_EXPLORE_WORKERS", 1), len(restricted_urls)))
+                        if workers > 1:
+                            seen = self._explore_restricted_parallel(restricted_urls, workers)
+                        else:
+                            # Authentication may come from the cookie checkpoint, without a driver
+                            if self.driver is None:
+                                self.initialize_driver(headless=self.config_manager.get_bool("AXE_HEADLESS", True))
+                                if not self._authenticate_driver(self.driver):
+                                    self.logger.error("Could not authenticate the exploration driver, using the specified restricted URLs")
+                                    self.authenticated_urls = restricted_urls.copy()
+                                    return self.authenticated_urls
                                 
-                                # Collect links on the page
-                                links = self.driver.find_elements(By.TAG_NAME, "a")
-                                for link in links:
-                                    try:
-                                        href = link.get_attribute("href")
-                                        if href and any(href.startswith(r) for r in restricted_urls):
-                                            if href not in self.authenticated_urls:
-                                                self.authenticated_urls.append(href)
-                                    except:
-                                        pass
-                            except Exception as e:
-                                self.logger.warning(f"Error exploring {base_url}: {e}")
+                            # Hung pages must not stall the exploration loop
+                            self.driver.set_page_load_timeout(15)
+                            
+                            seen = set()
+                            prefixes = self._restricted_prefixes
+                            for base_url in restricted_urls:
+                                try:
+                                    seen.update(self._collect_from_url(base_url, self.driver, prefixes))
+                                except Exception as e:
+                                    self.logger.warning(f"Error exploring {base_url}: {e}")
+                                    
+                        # Deduplicated through the set; sorted so runs produce the same URL order
+                        self.authenticated_urls = sorted(seen)
                         
                         self.logger.info(f"Collected {len(self.authenticated_urls)} authenticated URLs")
                 else:
                     self.logger.warning(f"Domain slug '{domain_slug}' not found in AUTH_DOMAINS")
-                    # Try alternative formats
-                    alt_slug = domain_slug.replace("_", "")
-                    if alt_slug in self.auth_config["domains"]:
-                        restricted_urls = self.auth_config["domains"][alt_slug].get("restricted_urls", [])
-                        self.authenticated_urls = restricted_urls.copy()
-                        self.logger.info(f"Found {len(self.authenticated_urls)} restricted URLs with alternate slug format")
                 
                 return self.authenticated_urls
                     
@@ -983,16 +1743,132 @@ class AuthenticationManager:
     
     def close(self) -> None:
         """Close the authentication driver and clean up resources."""
+        self._live_managers.discard(self)
+        # The cached wait holds the driver; let it go with the driver
+        self._wait_obj = None
+        if self._screenshot_pool is not None:
+            # Let queued screenshots reach the disk
+            self._screenshot_pool.shutdown(wait=True)
+            self._screenshot_pool = None
+            
+        if self.driver and not self._owns_driver:
+            # Borrowed browser: its owner closes it
+            self.driver = None
+            return
+            
+        if self.driver and not self._driver_handed_out:
+            try:
+                # Hand the driver back to the pool for the next manager
+                self._release_driver(self._driver_key, self.driver, origins=(self._base_url,))
+                self.logger.info("Authentication driver returned to the pool")
+                self.driver = None
+                return
+            except Exception as e:
+                self.logger.warning(f"Authentication driver not reusable, closing it: {e}")
+                
         if self.driver:
+            # A driver given out by get_authenticated_driver is never pooled, so no
+            # other manager can acquire or reset it: it is quit like an unpooled one
             try:
                     self.driver.quit()
                     self.logger.info("Authentication driver closed")
             except Exception as e:
                     self.logger.error(f"Error closing authentication driver: {e}")
             finally:
+                # quit() may fail before stopping chromedriver; make sure it is gone
+                try:
+                    self.driver.service.stop()
+                except Exception:
+                    pass
                 self.driver = None
 
-    def verify_authentication(self, driver: Optional[webdriver.Chrome] = None) -> bool:
+    @classmethod
+    def _acquire_driver(cls, key: tuple) -> "Optional[webdriver.Chrome]":
+            """Take an idle driver with compatible options from the pool, if any."""
+            with cls._driver_pool_lock:
+                drivers = cls._driver_pool.get(key)
+                return drivers.pop() if drivers else None
+
+    @classmethod
+    def _release_driver(
+        cls,
+        key: Optional[tuple],
+        driver: "webdriver.Chrome",
+        origins: Sequence[str] = ()
+    ) -> None:
+            """
+            Reset a driver's session state and put it back in the pool.
+        
+            Args:
+                key: Pool key the driver was created with
+                driver: Driver to reset and pool
+                origins: Origins whose storage must be wiped, besides the current page's
+            """
+            if key is None:
+                raise ValueError("driver was not created by initialize_driver")
+            
+            # sessionStorage lives in the tab: clear it while still on the last page
+            driver.execute_script("try { sessionStorage.clear(); } catch (e) {}")
+            current = urlparse(driver.current_url)
+            if current.scheme in ("http", "https"):
+                origins = (*origins, f"{current.scheme}://{current.netloc}")
+            
+            # Drop cookies, storage, cache and headers of the previous session before sharing the browser
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in dict.fromkeys(origin for origin in origins if origin):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": {}})
+            driver.get("about:blank")
+        
+            with cls._driver_pool_lock:
+                cls._driver_pool.setdefault(key, []).append(driver)
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+            """Quit every pooled authentication driver."""
+            with cls._driver_pool_lock:
+                drivers = [driver for pooled in cls._driver_pool.values() for driver in pooled]
+                cls._driver_pool.clear()
+            
+            for driver in drivers:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+    @classmethod
+    def shutdown_all(cls) -> None:
+            """Close every manager still holding a driver, then quit the pooled drivers."""
+            for manager in list(cls._live_managers):
+                try:
+                    manager.close()
+                except Exception:
+                    pass
+            cls.shutdown_pool()
+
+    def get_authenticated_driver(self) -> "Optional[webdriver.Chrome]":
+            """
+            Return the browser holding the authenticated session, for reuse by other components.
+        
+            Callers can open their own tabs with driver.switch_to.new_window('tab')
+            instead of starting a second browser and copying cookies into it.
+        
+            Returns:
+                The authentication driver, or None if no browser was started
+            """
+            if self.driver is not None:
+                # Shared from now on: close() must not pool it under the caller's feet
+                self._driver_handed_out = True
+            return self.driver
+
+    def __enter__(self) -> "AuthenticationManager":
+            return self
+
+    def __exit__(self, *exc) -> None:
+            self.close()
+
+    def verify_authentication(self, driver: "Optional[webdriver.Chrome]" = None) -> bool:
         """
         Verify that the authentication is still valid.
         
@@ -1012,10 +1888,8 @@ class AuthenticationManager:
             current_url = target_driver.current_url
             
             # Visit a protected URL from the restricted_urls list
-            domain_slug = self.config_manager.domain_to_slug(self.domain) if self.domain else None
-            
-            if domain_slug and domain_slug in self.auth_config["domains"]:
-                restricted_urls = self.auth_config["domains"][domain_slug].get("restricted_urls", [])
+            if self.domain_auth_config:
+                restricted_urls = self.domain_auth_config.get("restricted_urls", [])
                 if restricted_urls:
                     verify_url = restricted_urls[0]
                     self.logger.info(f"Verifying authentication by visiting: {verify_url}")
@@ -1024,7 +1898,7 @@ class AuthenticationManager:
                     target_driver.get(verify_url)
                     
                     # Wait for page to load
-                    time.sleep(3)
+                    self._wait_for_page_ready(10, target_driver)
                     
                     # Check if we got redirected to login
                     if "/auth/login" in target_driver.current_url:
@@ -1032,9 +1906,7 @@ class AuthenticationManager:
                         return False
                     
                     # Take screenshot for debugging
-                    if self.output_manager:
-                        screenshot_path = self.output_manager.get_path("screenshots", "auth_verify.png")
-                        target_driver.save_screenshot(str(screenshot_path))
+                    self._save_debug_screenshot("auth_verify.png", target_driver)
                     
                     # Return to original URL
                     target_driver.get(current_url)
@@ -1048,4 +1920,7 @@ class AuthenticationManager:
             
         except Exception as e:
             self.logger.error(f"Error verifying authentication: {e}")
-            return False
\ No newline at end of file
+            return False
+
+# Open managers are closed and pooled drivers quit when the interpreter exits
+atexit.register(AuthenticationManager.shutdown_all)
@@ -8,7 +8,8 @@ def concat_excel_sheets(file_path, output_path=None, sheet_names=None):
     
     Args:
         file_path (str): percorso del file Excel.
-        output_path (str, optional): percorso dove salvare il file Excel. Default è None.
+        output_path (str, optional): percorso dove salvare il file Excel (o Parquet se termina
+            con .parquet). Default è None.
         sheet_names (list, optional): lista di nomi di fogli da leggere. Default è None.
         
     Returns:
@@ -18,14 +19,13 @@ def concat_excel_sheets(file_path, output_path=None, sheet_names=None):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Il file {file_path} non esiste")
     
-    # Legge tutti i fogli se sheet_names è None
-    if sheet_names is None:
-        sheets = pd.read_excel(file_path, sheet_name=None)
-    else:
-        sheets = {sheet: pd.read_excel(file_path, sheet_name=sheet) for sheet in sheet_names}
-
-    # Concatena i DataFrame provenienti dai vari fogli
-    df_concat = pd.concat(sheets.values(), ignore_index=True)
+    # Apre il workbook una sola volta (openpyxl in read_only, che legge i fogli in
+    # streaming) e passa i fogli a pd.concat uno alla volta, senza tenere in memoria
+    # il dizionario di tutti i fogli
+    with pd.ExcelFile(file_path, engine='openpyxl',
+                      engine_kwargs={'read_only': True, 'data_only': True}) as xls:
+        names = xls.sheet_names if sheet_names is None else sheet_names
+        df_concat = pd.concat((pd.read_excel(xls, sheet_name=sheet) for sheet in names), ignore_index=True)
     
     # Se output_path è specificato, salva il DataFrame in un file Excel
     if output_path:
@@ -34,8 +34,15 @@ def concat_excel_sheets(file_path, output_path=None, sheet_names=None):
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir, exist_ok=True)
             
-        # Salva il file Excel usando openpyxl come engine
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        # Parquet per le pipeline che non hanno bisogno di un file Excel
+        if str(output_path).endswith('.parquet'):
+            df_concat.to_parquet(output_path, compression='zstd')
+            return output_path
+            
+        # Salva il file Excel con xlsxwriter, molto più veloce di openpyxl in scrittura;
+        # constant_memory non è usabile perché pandas scrive le celle per colonna
+        with pd.ExcelWriter(output_path, engine='xlsxwriter',
+                            engine_kwargs={'options': {'strings_to_urls': False}}) as writer:
             df_concat.to_excel(writer, index=False)
         return output_path
     
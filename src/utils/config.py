@@ -4,14 +4,21 @@ Centralizes configuration settings and provides environment-based overrides.
 """
 
 import os
+import re
+import copy
 import json
 import multiprocessing
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Union, Optional
 from urllib.parse import urlparse
 
 # ========== Helper Functions ==========
 
+# Accepted spellings of boolean environment variables
+_TRUE_VALUES = frozenset(("1", "true", "yes", "y", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "no", "n", "off"))
+
 def get_env(var_name: str, default: Any = None) -> Any:
     """
     Get an environment variable or return a default value.
@@ -37,9 +44,9 @@ def get_env_bool(var_name: str, default: bool = False) -> bool:
         Boolean value of the environment variable or default
     """
     value = get_env(var_name, "").lower()
-    if value in ("1", "true", "yes", "y", "on"):
+    if value in _TRUE_VALUES:
         return True
-    if value in ("0", "false", "no", "n", "off"):
+    if value in _FALSE_VALUES:
         return False
     return default
 
@@ -94,6 +101,13 @@ def get_env_list(var_name: str, default: List[str] = None, separator: str = ",")
         return default
     return [item.strip() for item in value.split(separator)]
 
+# Any character str.isalnum() rejects: \w is exactly isalnum() plus the underscore
+_SLUG_UNSAFE_RE = re.compile(r"[\W_]")
+
+# Same replacement for lowercased ASCII domains as a translation table
+_ASCII_SLUG_TABLE = str.maketrans({c: "_" for c in map(chr, range(128)) if not c.isalnum()})
+
+@lru_cache(maxsize=512)
 def generate_safe_slug(url: str) -> str:
     """
     Generate a safe slug from a URL or domain name.
@@ -115,7 +129,9 @@ def generate_safe_slug(url: str) -> str:
         domain = domain.replace("www.", "")
         
         # Replace non-alphanumeric characters with underscores
-        return "".join(c if c.isalnum() else "_" for c in domain).lower()
+        if domain.isascii():
+            return domain.lower().translate(_ASCII_SLUG_TABLE)
+        return _SLUG_UNSAFE_RE.sub("_", domain).lower()
     except Exception:
         # Fallback for invalid URLs
         return "unknown_domain"
@@ -133,23 +149,38 @@ CPU_COUNT = multiprocessing.cpu_count()
 DEFAULT_MAX_WORKERS = min(CPU_COUNT * 2, 32)  # 2 workers per CPU, max 32
 SELENIUM_POOL_SIZE = max(2, CPU_COUNT // 2)  # Pool of driver for Selenium
 
+def _load_json_config(path: str) -> Dict[str, Any]:
+    """Load a JSON configuration file."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _load_yaml_config(path: str) -> Dict[str, Any]:
+    """Load a YAML configuration file, importing yaml only when needed."""
+    import yaml
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+def _load_python_config(path: str) -> Dict[str, Any]:
+    """Load the public plain-data variables of a Python configuration module."""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("config_module", path)
+    config_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config_module)
+    return {name: value for name, value in vars(config_module).items()
+            if not name.startswith('_') and isinstance(value, (dict, list, str, int, float, bool))}
+
+# Configuration file loaders by suffix; anything else is treated as a Python module
+_CONFIG_LOADERS = {
+    ".json": _load_json_config,
+    ".yml": _load_yaml_config,
+    ".yaml": _load_yaml_config,
+}
+
 # Load configuration from file if specified
 if CONFIG_FILE and os.path.exists(CONFIG_FILE):
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            if CONFIG_FILE.endswith('.json'):
-                config_data = json.load(f)
-            elif CONFIG_FILE.endswith(('.yml', '.yaml')):
-                import yaml
-                config_data = yaml.safe_load(f)
-            else:
-                # Assume Python module with dict variables
-                import importlib.util
-                spec = importlib.util.spec_from_file_location("config_module", CONFIG_FILE)
-                config_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(config_module)
-                config_data = {name: value for name, value in vars(config_module).items() 
-                            if not name.startswith('_') and isinstance(value, (dict, list, str, int, float, bool))}
+        loader = _CONFIG_LOADERS.get(Path(CONFIG_FILE).suffix.lower(), _load_python_config)
+        config_data = loader(CONFIG_FILE)
         
         # Extract configurations
         if "OUTPUT_ROOT" in config_data:
@@ -167,6 +198,17 @@ if CONFIG_FILE and os.path.exists(CONFIG_FILE):
 # Get base URLs from environment or use defaults
 BASE_URLS = get_env_list("AXE_BASE_URLS", ["iccreabanca.it/it-IT/Pagine/default.aspx"])
 
+# Subdirectory of each component inside a domain's output root
+_DOMAIN_SUBDIRS = {
+    "crawler": "crawler_output",
+    "axe": "axe_output",
+    "analysis": "analysis_output",
+    "reports": "reports",
+    "logs": "logs",
+    "charts": "charts",
+    "temp": "temp",
+}
+
 # Create domain output structure
 def create_domain_output_structure(base_urls: List[str], root_output_dir: str) -> Dict[str, Dict[str, Path]]:
     """
@@ -180,36 +222,45 @@ def create_domain_output_structure(base_urls: List[str], root_output_dir: str) -
         Dictionary with output structures for each domain
     """
     domain_outputs = {}
+    root = Path(root_output_dir)
     
     for base_url in base_urls:
-        # Generate a safe slug for the domain
-        DOMAIN_SLUG = generate_safe_slug(base_url)
+        # Root directory of the domain, named after its safe slug
+        domain_root = root / generate_safe_slug(base_url)
         
-        # Create root directory for the domain
-        domain_root = Path(root_output_dir) / DOMAIN_SLUG
-        
-        # Directory structure for each domain
-        output_dirs = {
-            "root": domain_root,
-            "crawler": domain_root / "crawler_output",
-            "axe": domain_root / "axe_output",
-            "analysis": domain_root / "analysis_output",
-            "reports": domain_root / "reports",
-            "logs": domain_root / "logs",
-            "charts": domain_root / "charts",
-            "temp": domain_root / "temp"
-        }
+        # Directory structure for each domain (paths only, nothing is created here)
+        output_dirs = {"root": domain_root}
+        for component, subdirectory in _DOMAIN_SUBDIRS.items():
+            output_dirs[component] = domain_root / subdirectory
         
         domain_outputs[base_url] = output_dirs
     
     return domain_outputs
 
-# Generate the structures of output for the domains
-DOMAIN_OUTPUTS = create_domain_output_structure(BASE_URLS, OUTPUT_ROOT)
+# DOMAIN_OUTPUTS (output structures of the domains) is built on first access,
+# see __getattr__ below
 
 # ========== URL Configuration ==========
 
 def get_url_config(base_url: str) -> Dict[str, Any]:
+    """
+    Get the configuration for a specific URL.
+    
+    The configuration is built once per URL; each caller gets its own deep
+    copy, so changes to the returned dictionary do not leak into later calls.
+    get_url_config.cache_clear() drops the built configurations, e.g. after
+    changing the environment.
+    
+    Args:
+        base_url: Base URL to get the configuration for
+    
+    Returns:
+        Configuration dictionary for the URL
+    """
+    return copy.deepcopy(_build_url_config(base_url))
+
+@lru_cache(maxsize=None)
+def _build_url_config(base_url: str) -> Dict[str, Any]:
     """
     Generate configuration for a specific URL.
     
@@ -220,7 +271,7 @@ def get_url_config(base_url: str) -> Dict[str, Any]:
         Configuration dictionary for the URL
     """
     # Get output directories for this domain
-    domain_dirs = DOMAIN_OUTPUTS[base_url]
+    domain_dirs = _lazy_config("DOMAIN_OUTPUTS")[base_url]
     
     # Generate a safe slug for the domain
     DOMAIN_SLUG = generate_safe_slug(base_url)
@@ -279,8 +330,25 @@ def get_url_config(base_url: str) -> Dict[str, Any]:
         "output_dirs": domain_dirs
     }
 
-# Generate configuration for all URLs
-URL_CONFIGS = {url: get_url_config(url) for url in BASE_URLS}
+get_url_config.cache_clear = _build_url_config.cache_clear
+
+# Per-domain configurations, built on first access instead of at import time
+_LAZY_CONFIGS = {
+    "DOMAIN_OUTPUTS": lambda: create_domain_output_structure(BASE_URLS, OUTPUT_ROOT),
+    "URL_CONFIGS": lambda: {url: get_url_config(url) for url in BASE_URLS},
+}
+
+def _lazy_config(name: str) -> Any:
+    """Build a lazy module-level configuration once and store it as a global."""
+    if name not in globals():
+        globals()[name] = _LAZY_CONFIGS[name]()
+    return globals()[name]
+
+def __getattr__(name: str) -> Any:
+    """Resolve DOMAIN_OUTPUTS and URL_CONFIGS on first access (PEP 562)."""
+    if name in _LAZY_CONFIGS:
+        return _lazy_config(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ========== Global Configuration ==========
 
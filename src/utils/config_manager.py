@@ -1,23 +1,139 @@
 # src/utils/config_manager.py
 import os
+import re
 import json
+import hashlib
 import yaml
 import logging
 import multiprocessing
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TypeVar, Set, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar, Set, Callable
+import copy
 import datetime
+from collections import ChainMap
+from collections.abc import Mapping
+from functools import lru_cache, wraps
 from utils.config_schema_additions import CONFIG_SCHEMA_ADDITIONS
 
+# Parser libyaml in C quando disponibile, altrimenti quello puro Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parser JSON in Rust quando disponibile (stesso risultato per i file di configurazione)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 T = TypeVar('T')
+
+# Marca "nessun valore in cache", distinto da un valore None memorizzato
+_MISSING = object()
+
+# Sottodirectory di ogni componente nella directory di output di un dominio
+_DOMAIN_SUBDIRS = (
+    ("crawler", "crawler_output"),
+    ("axe", "axe_output"),
+    ("analysis", "analysis_output"),
+    ("reports", "reports"),
+    ("logs", "logs"),
+    ("charts", "charts"),
+    ("temp", "temp"),
+)
 _CONFIG_MANAGER_INSTANCE = None
 _INITIALIZING = False  # Flag to prevent recursion
 
+# Caratteri che str.isalnum() rifiuta: \w è esattamente isalnum() più l'underscore
+_SLUG_UNSAFE_RE = re.compile(r"[\W_]")
+
+@lru_cache(maxsize=256)
+def _parse_domain(domain: str) -> Tuple[str, str]:
+    """Dominio ripulito e relativo slug di un dominio o URL, calcolati una sola volta per valore."""
+    # Rimuovi protocollo e www, ed estrai solo il dominio base (senza path);
+    # replace e non removeprefix, per non cambiare i nomi delle directory esistenti
+    clean = domain.replace("http://", "").replace("https://", "").replace("www.", "")
+    clean = clean.split('/', 1)[0]
+    # Replace non-alphanumeric characters with underscores
+    return clean, _SLUG_UNSAFE_RE.sub("_", clean)
+
+def _computed(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Memorizza il risultato di una vista calcolata della configurazione
+    (get_*_config) fino al prossimo cambio di generazione delle fonti.
+    
+    Ogni chiamata riceve una copia profonda, così chi modifica il dizionario
+    restituito non altera le letture successive.
+    """
+    name = method.__name__
+    
+    @wraps(method)
+    def wrapper(self):
+        cached = self._computed_cache.get(name)
+        if cached is not None and cached[0] == self._gen:
+            return copy.deepcopy(cached[1])
+        result = method(self)
+        self._computed_cache[name] = (self._gen, result)
+        return copy.deepcopy(result)
+    return wrapper
+
+class _LazyDirs(Mapping):
+    """Mapping componente -> Path che crea ogni Path solo al primo accesso."""
+    
+    __slots__ = ("_dirs", "_paths")
+    
+    def __init__(self, dirs: Dict[str, str]):
+        self._dirs = dirs
+        self._paths: Dict[str, Path] = {}
+    
+    def __getitem__(self, component: str) -> Path:
+        path = self._paths.get(component)
+        if path is None:
+            path = self._paths[component] = Path(self._dirs[component])
+        return path
+    
+    def __iter__(self):
+        return iter(self._dirs)
+    
+    def __len__(self) -> int:
+        return len(self._dirs)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+def _parse_kv_lines(text: str):
+    """Coppie (chiave, valore) delle righe key=value, ignorando righe vuote e commenti."""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == '#':
+            continue
+        key, sep, value = line.partition('=')
+        if sep:
+            yield key.strip(), value.strip()
+
+@lru_cache(maxsize=8)
+def _resolve_config_file(cwd: str) -> Optional[str]:
+    """Cerca il file di configurazione predefinito partendo da cwd, una volta per directory."""
+    search_paths = (
+        os.path.join(cwd, 'config.json'),
+        os.path.join(cwd, 'config.yaml'),
+        os.path.join(cwd, 'config.yml'),
+        os.path.join(os.path.dirname(cwd), 'config.json'),
+        os.path.join(os.path.expanduser('~'), 'axeScraper', 'config.json'),
+        '/etc/axeScraper/config.json',
+    )
+    for path in search_paths:
+        if os.access(path, os.F_OK):
+            return path
+    return None
+
 def get_config_manager(project_name="axeScraper", config_file=None, cli_args=None):
     global _CONFIG_MANAGER_INSTANCE, _INITIALIZING
     if _CONFIG_MANAGER_INSTANCE is None and not _INITIALIZING:
         _INITIALIZING = True  # Set flag before initializing
-        _CONFIG_MANAGER_INSTANCE = ConfigurationManager(project_name, config_file, cli_args=cli_args)
+        _CONFIG_MANAGER_INSTANCE = ConfigurationManager.get_instance(project_name, config_file, cli_args)
         _INITIALIZING = False  # Reset flag after initialization
     return _CONFIG_MANAGER_INSTANCE
 
@@ -124,6 +240,39 @@ class ConfigurationManager:
     - Valori predefiniti (priorità minima)
     """
     
+    # Istanze condivise create da get_instance, per (progetto, file, argomenti CLI)
+    _instances: Dict[tuple, "ConfigurationManager"] = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(
+        cls,
+        project_name: str = "axeScraper",
+        config_file: Optional[Union[str, Path]] = None,
+        cli_args: Optional[Dict[str, Any]] = None
+    ) -> "ConfigurationManager":
+        """
+        Restituisce il gestore condiviso per questi parametri, creandolo alla prima richiesta.
+        
+        Evita di ripetere la ricerca e il parsing del file di configurazione a ogni
+        componente che ne ha bisogno.
+        
+        Args:
+            project_name: Nome del progetto
+            config_file: Percorso del file di configurazione
+            cli_args: Argomenti da linea di comando
+        """
+        key = (
+            project_name,
+            str(Path(config_file).resolve()) if config_file else None,
+            json.dumps(cli_args or {}, sort_keys=True, default=str),
+        )
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls._instances[key] = cls(project_name, config_file, cli_args=cli_args)
+            return instance
+    
     def __init__(
         self,
         project_name: str = "axeScraper",
@@ -176,10 +325,18 @@ class ConfigurationManager:
         
         # Cache delle configurazioni
         self._config_cache = {}
+        # Viste calcolate (get_*_config), valide per la generazione delle fonti in cui sono state create
+        self._gen = 0
+        self._computed_cache: Dict[str, tuple] = {}
         
         # Flag di debug
         self.debug_mode = False
         
+        # Ricarica serializzata (anche dal watcher del file) e stato del watcher opzionale
+        self._reload_lock = threading.RLock()
+        self._file_observer = None
+        self._reload_timer = None
+        
         # Carica le configurazioni
         self.reload_config()
         
@@ -197,25 +354,15 @@ class ConfigurationManager:
     def _find_config_file(self, config_file: Optional[Union[str, Path]]) -> Optional[Path]:
         if config_file:
             return Path(config_file)
-        search_paths = [
-            Path.cwd() / 'config.json',
-            Path.cwd() / 'config.yaml',
-            Path.cwd() / 'config.yml',
-            Path.cwd().parent / 'config.json',
-            Path.home() / 'axeScraper' / 'config.json',
-            Path('/etc/axeScraper/config.json')
-        ]
-        for path in search_paths:
-            if path.exists():
-                return path
-        return None
+        found = _resolve_config_file(os.getcwd())
+        return Path(found) if found else None
 
     def reload_config(self) -> bool:
         """Ricarica tutte le configurazioni."""
-        # Svuota la cache
-        self._config_cache = {}
-        # Carica la configurazione da file
-        self._load_file_config()
+        with self._reload_lock:
+            # Carica la configurazione da file
+            self._load_file_config()
+            self._rebuild_sources()
         self.logger.info("Configurazione ricaricata")
         
         # Log dei valori chiave
@@ -223,6 +370,90 @@ class ConfigurationManager:
         
         return True
     
+    def _rebuild_sources(self) -> None:
+        """Ricostruisce le fonti della configurazione e svuota la cache dei valori."""
+        self._config_cache = {}
+        self._gen += 1
+        # Fonti in ordine di priorità, con gli alias già risolti nelle chiavi standard;
+        # i valori annidati del file sono raggiungibili anche come "sezione.chiave"
+        file_values = self._flatten_config(self._file_config or {})
+        file_values.update(self._normalize_mapping(self._file_config or {}))
+        self._sources = ChainMap(self._normalize_mapping(self.cli_args), file_values)
+    
+    def set_cli_arg(self, key: str, value: Any) -> None:
+        """
+        Imposta un argomento da linea di comando dopo l'inizializzazione.
+        
+        Args:
+            key: Chiave di configurazione (standard o alias)
+            value: Nuovo valore
+        """
+        with self._reload_lock:
+            self.cli_args[key] = value
+            self._rebuild_sources()
+    
+    def enable_file_watch(self, debounce: float = 0.1) -> bool:
+        """
+        Ricarica la configurazione quando il file viene modificato, senza polling.
+        
+        Usa watchdog (inotify su Linux) se installato; più eventi ravvicinati
+        producono un solo reload_config dopo `debounce` secondi.
+        
+        Args:
+            debounce: Secondi di attesa dopo l'ultimo evento prima di ricaricare
+            
+        Returns:
+            True se il watcher è attivo
+        """
+        if self._file_observer is not None:
+            return True
+        if not self.config_file or not os.path.isdir(os.path.dirname(os.path.abspath(self.config_file))):
+            self.logger.warning("Nessun file di configurazione da osservare")
+            return False
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            self.logger.info("watchdog non installato, ricarica automatica della configurazione disattivata")
+            return False
+        
+        config_path = os.path.abspath(self.config_file)
+        manager = self
+        
+        class _ConfigFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Gli editor spesso salvano su un file temporaneo e poi lo rinominano
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if event.event_type in ("modified", "created", "moved", "closed") and config_path in paths:
+                    manager._schedule_reload(debounce)
+        
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_ConfigFileHandler(), os.path.dirname(config_path), recursive=False)
+        observer.start()
+        self._file_observer = observer
+        self.logger.info(f"Ricarica automatica attiva per {config_path}")
+        return True
+    
+    def disable_file_watch(self) -> None:
+        """Ferma il watcher avviato da enable_file_watch."""
+        observer, self._file_observer = self._file_observer, None
+        if self._reload_timer is not None:
+            self._reload_timer.cancel()
+            self._reload_timer = None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=2)
+    
+    def _schedule_reload(self, delay: float) -> None:
+        """Posticipa reload_config di `delay` secondi, annullando la richiesta precedente."""
+        with self._reload_lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+            self._reload_timer = threading.Timer(delay, self.reload_config)
+            self._reload_timer.daemon = True
+            self._reload_timer.start()
+    
     def _log_key_config_values(self) -> None:
         """Logga i valori delle configurazioni chiave."""
         self.logger.info("=== Valori di configurazione chiave ===")
@@ -258,20 +489,19 @@ class ConfigurationManager:
         if not self.config_file or not self.config_file.exists():
             return {}
         try:
-            with open(self.config_file, 'r') as f:
-                if self.config_file.suffix.lower() == '.json':
-                    self._file_config = json.load(f)
-                elif self.config_file.suffix.lower() in ('.yaml', '.yml'):
-                    self._file_config = yaml.safe_load(f)
-                else:
-                    # Tenta di parsare come file key=value
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith('#'):
-                            continue
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            self._file_config[key.strip()] = value.strip()
+            suffix = self.config_file.suffix.lower()
+            if suffix in ('.yaml', '.yml'):
+                self._file_config = self._load_yaml_with_cache()
+                if self.debug_mode:
+                    self.logger.debug(f"Loaded configuration from file: {self.config_file}")
+                return self._file_config
+            if suffix == '.json':
+                with open(self.config_file, 'rb') as f:
+                    self._file_config = _json_loads(f.read())
+            else:
+                # Tenta di parsare come file key=value
+                with open(self.config_file, 'r') as f:
+                    self._file_config = dict(_parse_kv_lines(f.read()))
             if self.debug_mode:
                 self.logger.debug(f"Loaded configuration from file: {self.config_file}")
             return self._file_config
@@ -279,6 +509,81 @@ class ConfigurationManager:
             self.logger.error(f"Errore caricando il file di configurazione {self.config_file}: {e}")
             return {}
     
+    def _load_yaml_with_cache(self) -> Dict[str, Any]:
+        """
+        Carica un file YAML riusando, se aggiornato, il risultato salvato in una cache JSON.
+        
+        La cache sta nella directory utente ($XDG_CACHE_HOME o ~/.cache, sotto axescraper/config),
+        non accanto al file di configurazione, e contiene percorso, mtime_ns e dimensione del
+        YAML da cui è stata generata; se non corrispondono più il YAML viene riparsato e la
+        cache riscritta. Viene scritta solo se il passaggio per JSON non altera i dati.
+        """
+        config_path = str(self.config_file.resolve())
+        stat = self.config_file.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        digest = hashlib.sha256(config_path.encode()).hexdigest()[:16]
+        cache_path = cache_root / "axescraper" / "config" / f"{digest}.json"
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = _json_loads(f.read())
+            if cached.get("path") == config_path and cached.get("stamp") == stamp:
+                return cached["data"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        with open(self.config_file, 'r') as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        
+        # Scrittura atomica; se la directory non è scrivibile si rinuncia alla cache
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps({"path": config_path, "stamp": stamp, "data": data})
+            # Chiavi non stringa o tuple cambierebbero nel passaggio per JSON
+            if json.loads(payload)["data"] != data:
+                self.logger.debug("Configurazione YAML non rappresentabile in JSON senza perdite, cache non scritta")
+                return data
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError/ValueError: valori YAML non rappresentabili in JSON (es. date)
+            self.logger.debug(f"Cache JSON della configurazione non scritta: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        return data
+    
+    @staticmethod
+    def _flatten_config(config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        """
+        Appiattisce le sezioni annidate in chiavi puntate (e.g. "crawler.max_urls").
+        
+        Restituisce solo le chiavi sotto una sezione, sottosezioni incluse come nodi.
+        """
+        flat = {}
+        for key, value in config.items():
+            if not isinstance(value, dict):
+                continue
+            for sub_key, sub_value in value.items():
+                path = f"{prefix}{key}.{sub_key}"
+                flat[path] = sub_value
+                if isinstance(sub_value, dict):
+                    flat.update(ConfigurationManager._flatten_config({path: sub_value}))
+        return flat
+    
+    def _normalize_mapping(self, mapping: Dict[str, Any]) -> Dict[str, Any]:
+        """Riporta le chiavi di una fonte alle chiavi standard; la chiave standard prevale sugli alias."""
+        normalized = {}
+        for key, value in mapping.items():
+            std_key = self._normalize_key(key)
+            if key == std_key or std_key not in normalized:
+                normalized[std_key] = value
+        return normalized
+    
     def _normalize_key(self, key: str) -> str:
         """Normalizza una chiave di configurazione usando gli alias."""
         # Se la chiave è già standardizzata, restituiscila com'è
@@ -314,12 +619,15 @@ class ConfigurationManager:
         # Normalizza la chiave
         std_key = self._normalize_key(key)
         
-        # Gestisci la cache
-        cache_key = f"{std_key}_{key}"  # Usa entrambi per distinguere richieste esplicite
-        if not use_cache and cache_key in self._config_cache:
-            del self._config_cache[cache_key]
-        if use_cache and cache_key in self._config_cache:
-            return self._config_cache[cache_key]
+        # Gestisci la cache: contiene il valore finale (dopo trasformazione e validazione)
+        # ed è svuotata da reload_config e set_cli_arg
+        cache_key = (std_key, key)  # Usa entrambi per distinguere richieste esplicite
+        if use_cache:
+            cached = self._config_cache.get(cache_key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+        else:
+            self._config_cache.pop(cache_key, None)
         
         # Inizializza con il valore predefinito più appropriato
         schema_default = None
@@ -329,42 +637,15 @@ class ConfigurationManager:
         # Valore finale predefinito (schema o fornito)
         final_default = default if default is not None else schema_default
         
-        # 1. Argomenti da linea di comando (controlla sia la chiave standard che gli alias)
-        if std_key in self.cli_args:
-            value = self.cli_args[std_key]
-            source = "CLI args (std key)"
-        elif key in self.cli_args:
-            value = self.cli_args[key]
-            source = "CLI args (alias)"
-        else:
-            # 2. File di configurazione (controlla sia la chiave standard che gli alias)
-            file_value = None
-            
-            # Controllo nidificato (e.g., "crawler.max_urls")
-            if '.' in std_key:
-                parts = std_key.split('.')
-                config = self._file_config
-                for part in parts:
-                    if not isinstance(config, dict) or part not in config:
-                        config = None
-                        break
-                    config = config[part]
-                file_value = config
-            else:
-                # Controllo diretto sulla chiave standard
-                if std_key in self._file_config:
-                    file_value = self._file_config[std_key]
-                # Controllo sulla chiave originale (potrebbe essere un alias)
-                elif key in self._file_config:
-                    file_value = self._file_config[key]
-            
-            if file_value is not None:
-                value = file_value
-                source = "config file"
-            else:
-                # 3. Valore predefinito
-                value = final_default
-                source = "default value"
+        # 1. Argomenti da linea di comando, 2. file di configurazione: una sola
+        # ricerca nella ChainMap, dove alias e chiavi annidate sono già risolti
+        value = self._sources.get(std_key)
+        source = "CLI args" if std_key in self._sources.maps[0] else "config file"
+        
+        if value is None:
+            # 3. Valore predefinito
+            value = final_default
+            source = "default value"
         
         # Applica eventuale trasformazione
         if transform and value is not None:
@@ -410,6 +691,43 @@ class ConfigurationManager:
         self._config_cache[cache_key] = value
         return value
 
+    def get_many(self, spec: Dict[str, tuple]) -> Dict[str, Any]:
+        """
+        Ottiene più valori di configurazione in un'unica chiamata.
+        
+        Ogni valore passa dallo stesso getter tipizzato di una richiesta singola,
+        quindi alias, schema e cache si comportano allo stesso modo.
+        
+        Args:
+            spec: Mapping chiave -> (tipo, default), con tipo tra int, float, bool, list e str
+            
+        Returns:
+            Dizionario chiave -> valore
+        """
+        getters = {
+            int: self.get_int,
+            float: self.get_float,
+            bool: self.get_bool,
+            list: self.get_list,
+        }
+        get = self.get
+        return {key: getters.get(kind, get)(key, default) for key, (kind, default) in spec.items()}
+    
+    def _typed_fast_value(self, std_key: str, kind: type) -> Any:
+        """
+        Valore già del tipo richiesto nelle fonti, che get restituirebbe invariato.
+        
+        Restituisce _MISSING quando serve il percorso completo di get (valore
+        assente o da convertire, schema con altro tipo o valori consentiti, debug).
+        """
+        value = self._sources.get(std_key, _MISSING)
+        if type(value) is not kind or self.debug_mode:
+            return _MISSING
+        schema = self.config_schema.get(std_key)
+        if schema is not None and (schema.get('type') != kind.__name__ or schema.get('allowed_values')):
+            return _MISSING
+        return value
+    
     def get_bool(self, key: str, default: bool = None) -> bool:
         """
         Ottiene un valore booleano.
@@ -421,9 +739,12 @@ class ConfigurationManager:
         Returns:
             Valore booleano
         """
-        schema_default = None
         std_key = self._normalize_key(key)
+        value = self._typed_fast_value(std_key, bool)
+        if value is not _MISSING:
+            return value
         
+        schema_default = None
         if std_key in self.config_schema and self.config_schema[std_key]['type'] == 'bool':
             schema_default = self.config_schema[std_key].get('default')
             
@@ -456,9 +777,12 @@ class ConfigurationManager:
         Returns:
             Valore intero
         """
-        schema_default = None
         std_key = self._normalize_key(key)
+        value = self._typed_fast_value(std_key, int)
+        if value is not _MISSING:
+            return value
         
+        schema_default = None
         if std_key in self.config_schema and self.config_schema[std_key]['type'] == 'int':
             schema_default = self.config_schema[std_key].get('default')
             
@@ -480,9 +804,12 @@ class ConfigurationManager:
         Returns:
             Valore float
         """
-        schema_default = None
         std_key = self._normalize_key(key)
+        value = self._typed_fast_value(std_key, float)
+        if value is not _MISSING:
+            return value
         
+        schema_default = None
         if std_key in self.config_schema and self.config_schema[std_key]['type'] == 'float':
             schema_default = self.config_schema[std_key].get('default')
             
@@ -595,14 +922,7 @@ class ConfigurationManager:
         Returns:
             Safe slug for filesystem use
         """
-        # Rimuovi protocollo e www, ed estrai solo il dominio base
-        domain = domain.replace("http://", "").replace("https://", "").replace("www.", "")
-        
-        # Estrai solo la parte del dominio (senza path)
-        domain = domain.split('/')[0]
-        
-        # Replace non-alphanumeric characters with underscores
-        return "".join(c if c.isalnum() else "_" for c in domain)
+        return _parse_domain(domain)[1]
     
     def get_all_domains(self) -> List[str]:
         """
@@ -623,91 +943,95 @@ class ConfigurationManager:
         Returns:
             Domain-specific configuration
         """
-        # Get domain slug for consistent reference
-        domain_slug = self.domain_to_slug(domain)
-        
-        # Clean domain for directory naming
-        clean_domain = domain.replace("http://", "").replace("https://", "").replace("www.", "").split('/')[0]
+        # Clean domain for directory naming and slug for consistent reference, in one pass
+        clean_domain, domain_slug = _parse_domain(domain)
         
         # Get base URLs
         base_urls = self.get_list("BASE_URLS")
         
-        # Domain output directories
+        # Domain output directories, preferring an existing alternate directory
         output_root = self.get_path("OUTPUT_DIR", "~/axeScraper/output", create=True)
         domain_root = output_root / domain_slug
-        
-        # Standard directory structure
-        output_dirs = {
-            "root": domain_root,
-            "crawler": domain_root / "crawler_output",
-            "axe": domain_root / "axe_output",
-            "analysis": domain_root / "analysis_output",
-            "reports": domain_root / "reports",
-            "logs": domain_root / "logs",
-            "charts": domain_root / "charts",
-            "temp": domain_root / "temp"
-        }
-        
-        # Alternate directory paths
         alt_root = output_root / clean_domain
-        if alt_root.exists() and alt_root != domain_root:
+        if alt_root != domain_root and alt_root.exists():
             self.logger.info(f"Found alternate domain directory: {alt_root}")
-            output_dirs = {
-                "root": alt_root,
-                "crawler": alt_root / "crawler_output",
-                "axe": alt_root / "axe_output",
-                "analysis": alt_root / "analysis_output",
-                "reports": alt_root / "reports",
-                "logs": alt_root / "logs",
-                "charts": alt_root / "charts",
-                "temp": alt_root / "temp"
-            }
+            domain_root = alt_root
+        
+        # Standard directory structure, built once for the chosen root; the
+        # string form feeds the component configs, output_dirs exposes Path
+        # objects created only for the components actually accessed
+        root_str = os.fspath(domain_root)
+        dir_strs = {"root": root_str}
+        for component, subdirectory in _DOMAIN_SUBDIRS:
+            dir_strs[component] = os.path.join(root_str, subdirectory)
+        output_dirs = _LazyDirs(dir_strs)
         
         # Create directories if needed
         if self.get_bool("CREATE_DIRS", True):
-            for dir_path in output_dirs.values():
-                os.makedirs(dir_path, exist_ok=True)
+            for dir_str in dir_strs.values():
+                os.makedirs(dir_str, exist_ok=True)
+        
+        # Crawler and Axe settings in one batched lookup
+        vals = self.get_many({
+            "CRAWLER_MAX_URLS": (int, None),
+            "CRAWLER_MAX_RETRIES": (int, 10),
+            "CRAWLER_REQUEST_DELAY": (float, None),
+            "CRAWLER_HYBRID_MODE": (bool, None),
+            "CRAWLER_PENDING_THRESHOLD": (int, None),
+            "CRAWLER_MAX_WORKERS": (int, min(self.cpu_count * 2, 16)),
+            "AXE_MAX_TEMPLATES": (int, None),
+            "AXE_POOL_SIZE": (int, None),
+            "AXE_SLEEP_TIME": (float, None),
+            "AXE_HEADLESS": (bool, None),
+            "AXE_RESUME": (bool, None),
+        })
+        
+        crawler_dir = dir_strs["crawler"]
+        axe_dir = dir_strs["axe"]
+        state_file = os.path.join(crawler_dir, f"crawler_state_{domain_slug}.pkl")
+        axe_report = os.path.join(axe_dir, f"accessibility_report_{domain_slug}.xlsx")
+        legacy_state_name = f"crawler_state_{clean_domain}.pkl"
         
         # Crawler configuration with flexible state file paths
         crawler_config = {
             "domains": clean_domain,
-            "max_urls": self.get_int("CRAWLER_MAX_URLS"),
-            "max_retries": self.get_int("CRAWLER_MAX_RETRIES", 10),
-            "request_delay": self.get_float("CRAWLER_REQUEST_DELAY"),
-            "hybrid_mode": self.get_bool("CRAWLER_HYBRID_MODE"),
-            "pending_threshold": self.get_int("CRAWLER_PENDING_THRESHOLD"),
-            "max_workers": self.get_int("CRAWLER_MAX_WORKERS", min(self.cpu_count * 2, 16)),
-            "output_dir": str(output_dirs["crawler"]),
-            "state_file": str(output_dirs["crawler"] / f"crawler_state_{domain_slug}.pkl"),
+            "max_urls": vals["CRAWLER_MAX_URLS"],
+            "max_retries": vals["CRAWLER_MAX_RETRIES"],
+            "request_delay": vals["CRAWLER_REQUEST_DELAY"],
+            "hybrid_mode": vals["CRAWLER_HYBRID_MODE"],
+            "pending_threshold": vals["CRAWLER_PENDING_THRESHOLD"],
+            "max_workers": vals["CRAWLER_MAX_WORKERS"],
+            "output_dir": crawler_dir,
+            "state_file": state_file,
         }
         
         # Add alternate state file paths for more robustness
         crawler_config["alternate_state_files"] = [
-            str(output_dirs["crawler"] / f"crawler_state_{clean_domain}.pkl"),
-            str(output_dirs["crawler"] / clean_domain / f"crawler_state_{clean_domain}.pkl"),
-            str(output_root / f"crawler_state_{clean_domain}.pkl")
+            os.path.join(crawler_dir, legacy_state_name),
+            os.path.join(crawler_dir, clean_domain, legacy_state_name),
+            os.path.join(os.fspath(output_root), legacy_state_name)
         ]
             
         # Configurazione di Axe analysis
         axe_config = {
             "domains": clean_domain,
-            "max_templates_per_domain": self.get_int("AXE_MAX_TEMPLATES"),
-            "pool_size": self.get_int("AXE_POOL_SIZE"),
-            "sleep_time": self.get_float("AXE_SLEEP_TIME"),
-            "headless": self.get_bool("AXE_HEADLESS"),
-            "resume": self.get_bool("AXE_RESUME"),
-            "excel_filename": str(output_dirs["axe"] / f"accessibility_report_{domain_slug}.xlsx"),
-            "visited_file": str(output_dirs["axe"] / f"visited_urls_{domain_slug}.txt"),
-            "output_folder": str(output_dirs["axe"]),
+            "max_templates_per_domain": vals["AXE_MAX_TEMPLATES"],
+            "pool_size": vals["AXE_POOL_SIZE"],
+            "sleep_time": vals["AXE_SLEEP_TIME"],
+            "headless": vals["AXE_HEADLESS"],
+            "resume": vals["AXE_RESUME"],
+            "excel_filename": axe_report,
+            "visited_file": os.path.join(axe_dir, f"visited_urls_{domain_slug}.txt"),
+            "output_folder": axe_dir,
         }
         
         # Configurazione del report finale
         report_config = {
-            "input_excel": str(output_dirs["axe"] / f"accessibility_report_{domain_slug}.xlsx"),
-            "concat_excel": str(output_dirs["analysis"] / f"accessibility_report_{domain_slug}_concat.xlsx"),
-            "output_excel": str(output_dirs["analysis"] / f"final_analysis_{domain_slug}.xlsx"),
-            "crawler_state": str(output_dirs["crawler"] / f"crawler_state_{domain_slug}.pkl"),
-            "charts_dir": str(output_dirs["charts"]),
+            "input_excel": axe_report,
+            "concat_excel": os.path.join(dir_strs["analysis"], f"accessibility_report_{domain_slug}_concat.xlsx"),
+            "output_excel": os.path.join(dir_strs["analysis"], f"final_analysis_{domain_slug}.xlsx"),
+            "crawler_state": state_file,
+            "charts_dir": dir_strs["charts"],
         }
         
         return {
@@ -719,6 +1043,7 @@ class ConfigurationManager:
             "report_config": report_config
         }
 
+    @_computed
     def get_pipeline_config(self) -> Dict[str, Any]:
         """
         Ottiene la configurazione specifica per la pipeline.
@@ -731,20 +1056,23 @@ class ConfigurationManager:
             "repeat_axe": self.get_int("REPEAT_ANALYSIS", 1),
             "resource_monitoring": {
                 "enabled": self.get_bool("RESOURCE_MONITORING", True),
-                "check_interval": self.get_int("RESOURCE_CHECK_INTERVAL", 3),
+                "check_interval": self.get_int("RESOURCE_CHECK_INTERVAL", 5),
                 "threshold_cpu": self.get_int("CPU_THRESHOLD", 90),
                 "threshold_memory": self.get_int("MEMORY_THRESHOLD", 85),
                 "cool_down_time": self.get_int("COOL_DOWN_TIME", 7)
             }
         }
     
+    @_computed
     def get_logging_config(self) -> Dict[str, Any]:
         """Get logging configuration with explicit file names."""
         output_root = self.get_path("OUTPUT_DIR", "~/axeScraper/output")
         log_dir = self.get_path("LOG_DIR", output_root / "logs", create=True)
+        # Livello globale, default di tutti i livelli per componente
+        level = self.get("LOG_LEVEL", "INFO")
         
         return {
-            "level": self.get("LOG_LEVEL", "INFO"),
+            "level": level,
             "format": self.get("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
             "date_format": self.get("LOG_DATE_FORMAT", "%Y-%m-%d %H:%M:%S"),
             "log_dir": str(log_dir),
@@ -756,32 +1084,33 @@ class ConfigurationManager:
             # Clear, explicit component log files
             "components": {
                 "crawler": {
-                    "level": self.get("CRAWLER_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("CRAWLER_LOG_LEVEL", level),
                     "log_file": "crawler.log"
                 },
                 "axe_analysis": {
-                    "level": self.get("ANALYSIS_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("ANALYSIS_LOG_LEVEL", level),
                     "log_file": "axe_analysis.log"
                 },
                 "report_analysis": {
-                    "level": self.get("REPORT_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("REPORT_LOG_LEVEL", level),
                     "log_file": "report_analysis.log"
                 },
                 "pipeline": {
-                    "level": self.get("PIPELINE_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("PIPELINE_LOG_LEVEL", level),
                     "log_file": "pipeline.log"
                 },
                 "auth_manager": {
-                    "level": self.get("AUTH_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("AUTH_LOG_LEVEL", level),
                     "log_file": "auth_manager.log"
                 },
                 "funnel_manager": {
-                    "level": self.get("FUNNEL_LOG_LEVEL", self.get("LOG_LEVEL", "INFO")),
+                    "level": self.get("FUNNEL_LOG_LEVEL", level),
                     "log_file": "funnel_manager.log"
                 }
             }
         }
         
+    @_computed
     def get_email_config(self) -> Dict[str, Any]:
         """
         Ottiene la configurazione dell'email.
@@ -10,7 +10,7 @@ AUTH_CONFIG_SCHEMA = {
     "AUTH_STRATEGIES": {
         "type": "list",
         "default": ["form"],
-        "description": "Authentication strategies to use (form, http_basic)",
+        "description": "Authentication strategies to use (form, http_form, http_basic)",
     },
     # HTTP Basic Auth settings
     "AUTH_BASIC_USERNAME": {
@@ -72,6 +72,17 @@ AUTH_CONFIG_SCHEMA = {
         "description": "CSS selector that indicates login error",
         "aliases": ["AUTH_FORM_ERROR_INDICATOR"]
     },
+    # HTTP form login (http_form strategy) - names of the POSTed form fields
+    "AUTH_HTTP_USERNAME_FIELD": {
+        "type": "str",
+        "default": "username",
+        "description": "Form field name for the username in HTTP form login"
+    },
+    "AUTH_HTTP_PASSWORD_FIELD": {
+        "type": "str",
+        "default": "password",
+        "description": "Form field name for the password in HTTP form login"
+    },
     "AUTH_PRE_LOGIN_ACTIONS": {
         "type": "list",
         "default": [],
@@ -92,6 +103,42 @@ AUTH_CONFIG_SCHEMA = {
         "default": [],
         "description": "URL patterns requiring authentication"
     },
+    # Cookie checkpoint settings
+    "AUTH_COOKIE_STORE": {
+        "type": "str",
+        "default": "",
+        "description": "Path of the JSON cookie checkpoint, written with owner-only permissions (empty disables it)"
+    },
+    "AUTH_COOKIE_TTL": {
+        "type": "int",
+        "default": 3600,
+        "description": "Seconds a cookie checkpoint stays valid (0 disables it)"
+    },
+    "AUTH_EXPLORE_WORKERS": {
+        "type": "int",
+        "default": 1,
+        "description": "Parallel browsers used to explore the restricted area (1 reuses the logged-in browser)"
+    },
+    "AUTH_COOKIE_BANNER_OBSERVER": {
+        "type": "bool",
+        "default": False,
+        "description": "Dismiss cookie banners automatically on the pages of the login flow"
+    },
+    "AUTH_WAIT_TIMEOUT": {
+        "type": "int",
+        "default": 20,
+        "description": "Default timeout in seconds of the explicit waits used during login"
+    },
+    "AUTH_POLL_INTERVAL": {
+        "type": "float",
+        "default": 0.1,
+        "description": "Seconds between polls of the explicit waits used during login"
+    },
+    "AUTH_DEBUG_SCREENSHOTS": {
+        "type": "bool",
+        "default": False,
+        "description": "Save screenshots of the login page, result and errors"
+    },
 }
 
 # Funnel configuration
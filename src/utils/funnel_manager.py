@@ -43,7 +43,7 @@ class FunnelManager:
             output_manager: Output manager for managing files and directories
             auth_manager: Authentication manager for authenticated funnels
         """
-        self.config_manager = config_manager or ConfigurationManager(project_name="axeScraper")
+        self.config_manager = config_manager or ConfigurationManager.get_instance("axeScraper")
         self.domain = domain
         self.output_manager = output_manager
         self.auth_manager = auth_manager
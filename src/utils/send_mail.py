@@ -1,4 +1,5 @@
 import logging
+import shlex
 import subprocess
 from .config import EMAIL_CONFIG
 from .logging_config import get_logger
@@ -15,11 +16,14 @@ logger = get_logger("email_sender", domain=real_domain)
 
 def send_email_report(excel_files, recipient_email=EMAIL_CONFIG["recipient_email"]):
     
-    # Costruisci l'elenco degli allegati
-    attachments = " ".join([f'-a "{f}"' for f in excel_files])
-    command = f'echo "{EMAIL_CONFIG["subject"]}" | {EMAIL_CONFIG["mutt_command"]} "{EMAIL_CONFIG["body"]}" {attachments} -- {recipient_email}'
-    logger.info("Invio email con il report: %s", command)
-    result = subprocess.run(command, shell=True)
+    # Un unico messaggio con tutti gli allegati: mutt apre una sola sessione SMTP
+    attachments = []
+    for f in excel_files:
+        attachments.extend(["-a", str(f)])
+    command = shlex.split(EMAIL_CONFIG["mutt_command"]) + [EMAIL_CONFIG["body"]] + attachments + ["--", recipient_email]
+    logger.info("Invio email con il report: %s", shlex.join(command))
+    # Il corpo viene passato su stdin senza avviare una shell intermedia
+    result = subprocess.run(command, input=f'{EMAIL_CONFIG["subject"]}\n', text=True)
     if result.returncode == 0:
         logger.info("Email inviata con successo.")
     else: